@@ -0,0 +1,53 @@
+"""Response classes shared by the API routes."""
+
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from fastapi.utils import is_body_allowed_for_status_code
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson, several times faster than stdlib json on large lists."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+class StaticJSON:
+    """JSON payload that is constant per deploy: encoded once, revalidated with an ETag."""
+
+    def __init__(self, content: Any, max_age: int = 300):
+        self.body = orjson.dumps(content, option=_ORJSON_OPTIONS)
+        self.etag = f'"{hashlib.sha1(self.body).hexdigest()}"'
+        self.headers = {"ETag": self.etag, "Cache-Control": f"public, max-age={max_age}"}
+
+    def response(self, request: Request) -> Response:
+        """Return the pre-encoded body, or 304 if the client already holds it."""
+        if self.etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers=self.headers)
+        return Response(self.body, media_type="application/json", headers=self.headers)
+
+
+async def _http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
+async def _validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())}, status_code=422)
+
+
+def register_exception_handlers(app: FastAPI):
+    """Render error responses (404s, 422s) with orjson like every other response."""
+    app.add_exception_handler(StarletteHTTPException, _http_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(RequestValidationError, _validation_exception_handler)  # type: ignore[arg-type]
@@ -1,15 +1,19 @@
 """Ingestion orchestration endpoints."""
 
 import logging
-import threading
+import os
 import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Literal
 
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+from anyio import from_thread
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from ...application.ports.vector_store import VectorStorePort
 from ...application.services.assistant import ConnectorAssistant
 from ...application.services.chunking import ChunkConfig
 from ...application.services.orchestrator import IngestionOrchestrator
@@ -19,13 +23,15 @@ from ...infrastructure.adapters.data_sources.mongodb import MongoDBAdapter
 from ...infrastructure.adapters.data_sources.s3 import S3Adapter
 from ...infrastructure.adapters.data_sources.sql import SQLAdapter
 from ...infrastructure.adapters.data_sources.web_scraper import WebScraperAdapter
+from ...infrastructure.adapters.vector_stores.buffering import BufferingVectorStore
 from ...infrastructure.adapters.vector_stores.milvus import MilvusAdapter
 from ...infrastructure.adapters.vector_stores.opensearch import OpenSearchAdapter
 from ...infrastructure.adapters.vector_stores.pgvector import PGVectorAdapter
 from ...infrastructure.adapters.vector_stores.pinecone import PineconeAdapter
 from ...infrastructure.adapters.vector_stores.qdrant import QdrantAdapter
-from ...infrastructure.logging.log_manager import log_manager, stream_logs
+from ...infrastructure.logging.log_manager import job_logging, log_manager, stream_logs
 from ...infrastructure.persistence.opensearch_store import OpenSearchStore
+from .models import _models_snapshot
 
 router = APIRouter()
 
@@ -36,22 +42,30 @@ logger = logging.getLogger(__name__)
 # Initialize OpenSearch storage for jobs
 jobs_store = OpenSearchStore("marie_rag_indexing_jobs")
 
-# Track running threads
-active_threads: dict[str, threading.Thread] = {}
+# Bounded pool for ingestion jobs; jobs beyond INGEST_WORKERS wait in its queue
+INGEST_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("INGEST_WORKERS", "4")), thread_name_prefix="ingest"
+)
+active_jobs: dict[str, Future] = {}
+
+# Jobs that are waiting in INGEST_POOL or currently running
+_ACTIVE_STATUSES = ("queued", "running")
 
 
 class IngestionRequest(BaseModel):
+    """Ingestion payload; validated once on arrival so bad input is a 422, not a failed job."""
+
     plugin_id: str
     config: dict[str, Any] = {}
-    chunk_settings: dict[str, Any] = {}
+    chunk_settings: ChunkConfig = ChunkConfig()
     vector_store: str = "opensearch"
     vector_store_config: dict[str, Any] = {}
     index_name: str = "default_index"
     embedding_model: str = "all-MiniLM-L6-v2"
     embedding_provider: str = "huggingface"
     embedding_config: dict[str, Any] = {}
-    execution_mode: str = "sequential"
-    max_workers: int = 4
+    execution_mode: Literal["sequential", "parallel"] = "sequential"
+    max_workers: int = Field(4, ge=1)
 
 
 class AssistantRequest(BaseModel):
@@ -75,24 +89,32 @@ VECTOR_STORE_PLUGINS = {
     "pgvector": PGVectorAdapter,
 }
 
+
+def _build_vector_store(vs_class: Any, config: dict[str, Any]) -> VectorStorePort:
+    """Instantiate a vector store, optionally coalescing small upserts ("buffer_chunks")."""
+    vector_store: VectorStorePort = vs_class(config)
+    if config.get("buffer_chunks"):
+        return BufferingVectorStore(
+            vector_store,
+            batch_size=int(config.get("buffer_size", 1000)),
+            flush_interval=float(config.get("buffer_flush_ms", 500)) / 1000,
+        )
+    return vector_store
+
+
+def _submit_job(job_id: str, job: Callable[[], None]) -> None:
+    """Queue a job on INGEST_POOL and track its future until it finishes."""
+    future = active_jobs[job_id] = INGEST_POOL.submit(job)
+    # Runs right away if the job already finished, so no done future is left behind
+    future.add_done_callback(lambda _: active_jobs.pop(job_id, None))
+
+
 # In-memory storage for jobs (TODO: persist to database)
 ingestion_jobs: dict[str, dict[str, Any]] = {}
 
-# Mock embedding models for assistant
-embedding_models: list[dict[str, Any]] = [
-    {
-        "id": "2",
-        "name": "Llama 3 (Ollama)",
-        "provider": "ollama",
-        "model": "llama3",
-        "status": "active",
-        "config": {"base_url": "http://localhost:11434"},
-    },
-]
-
 
 @router.post("/ingest")
-async def trigger_ingestion(request: IngestionRequest, background_tasks: BackgroundTasks):
+def trigger_ingestion(request: IngestionRequest):
     """Trigger an ingestion job."""
     # Data Source Adapter Selection
     plugin_class: Any = DATA_SOURCE_PLUGINS.get(request.plugin_id)
@@ -106,13 +128,13 @@ async def trigger_ingestion(request: IngestionRequest, background_tasks: Backgro
         raise HTTPException(
             status_code=400, detail=f"Vector store {request.vector_store} not supported"
         )
-    vector_store = vs_class(request.vector_store_config)
+    vector_store = _build_vector_store(vs_class, request.vector_store_config)
 
     # Create job record with full configuration for retry
     job_id = str(uuid.uuid4())
     job_data = {
         "id": job_id,
-        "status": "running",
+        "status": "queued",
         "data_source_id": request.plugin_id,
         "vector_store_id": request.vector_store,
         "index_name": request.index_name,
@@ -127,7 +149,7 @@ async def trigger_ingestion(request: IngestionRequest, background_tasks: Backgro
         "config": {
             "data_source_config": request.config,
             "vector_store_config": request.vector_store_config,
-            "chunk_settings": request.chunk_settings,
+            "chunk_settings": request.chunk_settings.model_dump(exclude_unset=True),
             "embedding_model": request.embedding_model,
             "embedding_provider": request.embedding_provider,
             "embedding_config": request.embedding_config,
@@ -149,13 +171,12 @@ async def trigger_ingestion(request: IngestionRequest, background_tasks: Backgro
     # Callback to set total documents
     def set_total(total):
         jobs_store.update(job_id, {"total_documents": total})
-        logger.info(f"Job {job_id} - Total documents to process: {total}")
+        logger.info("Job %s - Total documents to process: %s", job_id, total)
 
-    chunk_config = ChunkConfig(**request.chunk_settings)
     orchestrator = IngestionOrchestrator(
         data_source=data_source,
         vector_store=vector_store,
-        chunk_config=chunk_config,
+        chunk_config=request.chunk_settings,
         index_name=request.index_name,
         embedding_model=request.embedding_model,
         embedding_provider=request.embedding_provider,
@@ -169,10 +190,17 @@ async def trigger_ingestion(request: IngestionRequest, background_tasks: Backgro
     def run_job():
         """Run the ingestion job and update job status."""
         try:
-            logger.info(f"Starting ingestion job {job_id}")
-            result = orchestrator.run()
-            logger.info(f"Job {job_id} completed successfully")
+            logger.info("Starting ingestion job %s", job_id)
             jobs_store.update(
+                job_id,
+                {"status": "running", "last_update": datetime.now(timezone.utc).isoformat()},
+            )
+            with job_logging(job_id):
+                result = orchestrator.run()
+            if "error" in result:
+                raise RuntimeError(result["error"])
+            logger.info("Job %s completed successfully", job_id)
+            job = jobs_store.update(
                 job_id,
                 {
                     "status": "completed",
@@ -185,7 +213,6 @@ async def trigger_ingestion(request: IngestionRequest, background_tasks: Backgro
 
             # Calculate average speeds
             try:
-                job = jobs_store.get(job_id)
                 if job:
                     start_time = datetime.fromisoformat(job["started_at"])
                     end_time = datetime.now(timezone.utc)
@@ -203,12 +230,15 @@ async def trigger_ingestion(request: IngestionRequest, background_tasks: Backgro
                             },
                         )
                         logger.info(
-                            f"Job {job_id} completed - Avg: {docs_per_second:.2f} docs/s, {chunks_per_second:.2f} chunks/s"
+                            "Job %s completed - Avg: %.2f docs/s, %.2f chunks/s",
+                            job_id,
+                            docs_per_second,
+                            chunks_per_second,
                         )
             except Exception as e:
-                logger.warning(f"Could not calculate average speeds: {e}")
+                logger.warning("Could not calculate average speeds: %s", e)
         except Exception as e:
-            logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+            logger.error("Job %s failed: %s", job_id, e, exc_info=True)
             jobs_store.update(
                 job_id,
                 {
@@ -218,33 +248,29 @@ async def trigger_ingestion(request: IngestionRequest, background_tasks: Backgro
                     "error": str(e),
                 },
             )
-        finally:
-            # Cleanup thread tracking
-            if job_id in active_threads:
-                del active_threads[job_id]
 
-    # Run ingestion as FastAPI background task (non-blocking, managed by uvicorn)
-    background_tasks.add_task(run_job)
+    # Run ingestion on the bounded ingest pool (non-blocking; queued if all workers are busy)
+    _submit_job(job_id, run_job)
 
-    logger.info(f"Job {job_id} added to background tasks queue")
+    logger.info("Job %s added to ingestion queue", job_id)
 
     return {
         "status": "success",
-        "message": "Ingestion started",
+        "message": "Ingestion queued",
         "job_id": job_id,
         "vector_store": request.vector_store,
     }
 
 
 @router.get("/ingest/logs")
-async def get_ingestion_logs():
-    """Stream ingestion logs via Server-Sent Events."""
-    q = log_manager.subscribe()
+async def get_ingestion_logs(job_id: str | None = None):
+    """Stream ingestion logs via Server-Sent Events, optionally for a single job."""
+    q = log_manager.subscribe(job_id)
     return StreamingResponse(stream_logs(q), media_type="text/event-stream")
 
 
 @router.get("/jobs")
-async def get_jobs():
+def get_jobs():
     """Get all ingestion jobs."""
     jobs_list = jobs_store.list()
     # Sort by started_at descending
@@ -252,17 +278,25 @@ async def get_jobs():
     return {"jobs": jobs_list}
 
 
+def _worker_state(job_id: str) -> str | None:
+    """State of the job's future in this process, or None if no worker holds it."""
+    future = active_jobs.get(job_id)
+    if future is None or future.done():
+        return None
+    return "running" if future.running() else "queued"
+
+
 @router.get("/jobs/{job_id}")
-async def get_job(job_id: str):
-    """Get details of a specific ingestion job."""
+def get_job(job_id: str):
+    """Get details of a specific ingestion job, including its live worker state."""
     job = jobs_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return job
+    return {**job, "worker_state": _worker_state(job_id)}
 
 
 @router.post("/jobs/{job_id}/retry")
-async def retry_job(job_id: str, background_tasks: BackgroundTasks):
+def retry_job(job_id: str):
     """Retry a failed or completed ingestion job with the same configuration."""
     # Get original job
     original_job = jobs_store.get(job_id)
@@ -270,7 +304,7 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
         raise HTTPException(status_code=404, detail="Job not found")
 
     # Only allow retry for failed or completed jobs
-    if original_job.get("status") == "running":
+    if original_job.get("status") in _ACTIVE_STATUSES:
         raise HTTPException(status_code=400, detail="Cannot retry a running job")
 
     # Try to get configuration from job, or fallback to data source
@@ -280,7 +314,8 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
         # Old job without config stored - try to get from data source
         from ...api.routes.sources import sources_store
 
-        data_sources = sources_store.load()
+        # The sources store is async; run its call on the event loop from this worker thread
+        data_sources = from_thread.run(sources_store.list)
         # Search by type (plugin_id) since old jobs store plugin type, not source id
         data_source = next(
             (s for s in data_sources if s.get("type") == original_job["data_source_id"]), None
@@ -323,13 +358,13 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
             status_code=400, detail=f"Vector store {original_job['vector_store_id']} not supported"
         )
 
-    vector_store = vs_class(config["vector_store_config"])
+    vector_store = _build_vector_store(vs_class, config["vector_store_config"])
 
     # Create new job
     new_job_id = str(uuid.uuid4())
     job_data = {
         "id": new_job_id,
-        "status": "running",
+        "status": "queued",
         "data_source_id": original_job["data_source_id"],
         "vector_store_id": original_job["vector_store_id"],
         "index_name": original_job["index_name"],
@@ -356,7 +391,7 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
     # Callback to set total documents
     def set_retry_total(total):
         jobs_store.update(new_job_id, {"total_documents": total})
-        logger.info(f"Retry job {new_job_id} - Total documents to process: {total}")
+        logger.info("Retry job %s - Total documents to process: %s", new_job_id, total)
 
     # Create orchestrator
     chunk_config = ChunkConfig(**config["chunk_settings"])
@@ -377,10 +412,17 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
     def run_retry_job():
         """Run the retry job."""
         try:
-            logger.info(f"Starting retry job {new_job_id} (original: {job_id})")
-            result = orchestrator.run()
-            logger.info(f"Retry job {new_job_id} completed successfully")
+            logger.info("Starting retry job %s (original: %s)", new_job_id, job_id)
             jobs_store.update(
+                new_job_id,
+                {"status": "running", "last_update": datetime.now(timezone.utc).isoformat()},
+            )
+            with job_logging(new_job_id):
+                result = orchestrator.run()
+            if "error" in result:
+                raise RuntimeError(result["error"])
+            logger.info("Retry job %s completed successfully", new_job_id)
+            job = jobs_store.update(
                 new_job_id,
                 {
                     "status": "completed",
@@ -393,7 +435,6 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
 
             # Calculate average speeds
             try:
-                job = jobs_store.get(new_job_id)
                 if job:
                     start_time = datetime.fromisoformat(job["started_at"])
                     end_time = datetime.now(timezone.utc)
@@ -411,12 +452,15 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
                             },
                         )
                         logger.info(
-                            f"Retry job {new_job_id} completed - Avg: {docs_per_second:.2f} docs/s, {chunks_per_second:.2f} chunks/s"
+                            "Retry job %s completed - Avg: %.2f docs/s, %.2f chunks/s",
+                            new_job_id,
+                            docs_per_second,
+                            chunks_per_second,
                         )
             except Exception as e:
-                logger.warning(f"Could not calculate average speeds: {e}")
+                logger.warning("Could not calculate average speeds: %s", e)
         except Exception as e:
-            logger.error(f"Retry job {new_job_id} failed: {e}", exc_info=True)
+            logger.error("Retry job %s failed: %s", new_job_id, e, exc_info=True)
             jobs_store.update(
                 new_job_id,
                 {
@@ -426,14 +470,11 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
                     "error": str(e),
                 },
             )
-        finally:
-            if new_job_id in active_threads:
-                del active_threads[new_job_id]
 
-    # Run retry job in background
-    background_tasks.add_task(run_retry_job)
+    # Run retry job on the ingest pool
+    _submit_job(new_job_id, run_retry_job)
 
-    logger.info(f"Retry job {new_job_id} created from original job {job_id}")
+    logger.info("Retry job %s created from original job %s", new_job_id, job_id)
 
     return {
         "status": "success",
@@ -444,13 +485,13 @@ async def retry_job(job_id: str, background_tasks: BackgroundTasks):
 
 
 @router.post("/jobs/{job_id}/cancel")
-async def cancel_job(job_id: str):
+def cancel_job(job_id: str):
     """Cancel a running ingestion job."""
     job = jobs_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    if job.get("status") != "running":
+    if job.get("status") not in _ACTIVE_STATUSES:
         raise HTTPException(status_code=400, detail="Only running jobs can be cancelled")
 
     # Update job status to failed with cancellation message
@@ -463,11 +504,12 @@ async def cancel_job(job_id: str):
         },
     )
 
-    # Clean up thread if exists
-    if job_id in active_threads:
-        del active_threads[job_id]
+    # Drop the job from the queue if it hasn't started yet
+    future = active_jobs.pop(job_id, None)
+    if future:
+        future.cancel()
 
-    logger.info(f"Job {job_id} cancelled by user")
+    logger.info("Job %s cancelled by user", job_id)
 
     return {
         "status": "success",
@@ -477,20 +519,20 @@ async def cancel_job(job_id: str):
 
 
 @router.delete("/jobs/{job_id}")
-async def delete_job(job_id: str):
+def delete_job(job_id: str):
     """Delete an ingestion job."""
     job = jobs_store.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
 
     # Only allow deletion of non-running jobs
-    if job.get("status") == "running":
+    if job.get("status") in _ACTIVE_STATUSES:
         raise HTTPException(status_code=400, detail="Cannot delete a running job. Cancel it first.")
 
     # Delete the job
     jobs_store.delete(job_id)
 
-    logger.info(f"Job {job_id} deleted")
+    logger.info("Job %s deleted", job_id)
 
     return {
         "status": "success",
@@ -505,7 +547,7 @@ async def assistant_connector(request: AssistantRequest):
     # Try to find an Ollama model to use for the assistant
     ollama_url = "http://localhost:11434"
     assistant_model = "llama3"
-    for m in embedding_models:
+    for m in _models_snapshot():
         if m["provider"] == "ollama":
             ollama_url = m.get("config", {}).get("base_url", ollama_url)
             assistant_model = m.get("model", assistant_model)
@@ -1,14 +1,13 @@
 """Embedding model management endpoints."""
 
+import threading
+import uuid
 from typing import Any
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
-from ...infrastructure.external_apis.model_search import (
-    search_huggingface_models,
-    search_ollama_models,
-)
+from ...infrastructure.external_apis.model_search import search_models as search_provider_models
 
 router = APIRouter()
 
@@ -20,10 +19,10 @@ class ModelCreate(BaseModel):
     config: dict[str, Any] = {}
 
 
-# In-memory storage for demo purposes
+# In-memory storage for demo purposes, keyed by model id
 # TODO: Replace with database persistence
-embedding_models: list[dict[str, Any]] = [
-    {
+embedding_models: dict[str, dict[str, Any]] = {
+    "1": {
         "id": "1",
         "name": "MiniLM (Local)",
         "provider": "huggingface",
@@ -31,7 +30,7 @@ embedding_models: list[dict[str, Any]] = [
         "status": "active",
         "config": {},
     },
-    {
+    "2": {
         "id": "2",
         "name": "Llama 3 (Ollama)",
         "provider": "ollama",
@@ -39,40 +38,60 @@ embedding_models: list[dict[str, Any]] = [
         "status": "active",
         "config": {"base_url": "http://localhost:11434"},
     },
-]
+}
+# New models get random uuid4 ids, so ids never collide even across restarts.
+# Handlers run on the event loop and in the threadpool; all access goes through
+# the lock and readers work on snapshots.
+_models_lock = threading.RLock()
+
+
+def _models_snapshot() -> list[dict[str, Any]]:
+    with _models_lock:
+        return [dict(m) for m in embedding_models.values()]
 
 
 @router.get("/models")
 async def get_models():
     """Get all configured embedding models."""
-    return {"models": embedding_models}
+    return {"models": _models_snapshot()}
 
 
 @router.post("/models")
 async def add_model(model: ModelCreate):
     """Add a new embedding model configuration."""
+    model_id = uuid.uuid4().hex
     new_model = {
-        "id": str(len(embedding_models) + 1),
+        "id": model_id,
         "name": model.name,
         "provider": model.provider,
         "model": model.model,
         "status": "active",
         "config": model.config,
     }
-    embedding_models.append(new_model)
+    with _models_lock:
+        embedding_models[model_id] = new_model
     return new_model
 
 
 @router.delete("/models/{model_id}")
 async def delete_model(model_id: str):
     """Delete an embedding model configuration."""
-    global embedding_models
-    embedding_models = [m for m in embedding_models if m["id"] != model_id]
+    with _models_lock:
+        embedding_models.pop(model_id, None)
     return {"status": "success"}
 
 
+def _ollama_base_url() -> str:
+    # Try to get base_url from existing ollama models if any
+    for m in _models_snapshot():
+        if m["provider"] == "ollama":
+            base_url: str = m.get("config", {}).get("base_url", "http://localhost:11434")
+            return base_url
+    return "http://localhost:11434"
+
+
 @router.get("/models/search")
-async def search_models(
+def search_models(
     provider: str = Query("huggingface"),
     query: str = Query(""),
 ):
@@ -80,17 +99,20 @@ async def search_models(
     if not query:
         return {"results": []}
 
-    if provider == "huggingface":
-        results = search_huggingface_models(query)
-    elif provider == "ollama":
-        # Try to get base_url from existing ollama models if any
-        base_url = "http://localhost:11434"
-        for m in embedding_models:
-            if m["provider"] == "ollama":
-                base_url = m.get("config", {}).get("base_url", base_url)
-                break
-        results = search_ollama_models(query, base_url)
-    else:
+    try:
+        results = search_provider_models(provider, query, _ollama_base_url())
+    except ValueError:
         return {"error": "Unsupported provider"}
 
     return {"results": results}
+
+
+@router.get("/models/{model_id}")
+async def get_model(model_id: str):
+    """Get a specific embedding model configuration."""
+    with _models_lock:
+        model = embedding_models.get(model_id)
+        model = dict(model) if model else None
+    if not model:
+        raise HTTPException(status_code=404, detail="Model not found")
+    return model
@@ -1,22 +1,37 @@
 """Data source plugin endpoints."""
 
+import functools
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from bson import ObjectId
-from fastapi import APIRouter, HTTPException, Query
+from cachetools import TTLCache
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
-from pymongo import MongoClient
 from pymongo.errors import ServerSelectionTimeoutError
 
 from ...infrastructure.adapters.data_sources.google_drive import GoogleDriveAdapter
 from ...infrastructure.adapters.data_sources.local_file import LocalFileAdapter
-from ...infrastructure.adapters.data_sources.mongodb import MongoDBAdapter
+from ...infrastructure.adapters.data_sources.mongodb import MongoDBAdapter, get_mongo_client
 from ...infrastructure.adapters.data_sources.s3 import S3Adapter
 from ...infrastructure.adapters.data_sources.sql import SQLAdapter
 from ...infrastructure.adapters.data_sources.web_scraper import WebScraperAdapter
+from ..responses import StaticJSON
 
 router = APIRouter()
 
+# Upper bound for a schema-sampling aggregation on the server
+SAMPLE_MAX_TIME_MS = 3000
+
+# Fans out independent MongoDB metadata calls for the bootstrap endpoint
+_MONGO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mongo-metadata")
+
+# Schemas rarely change between UI refreshes; keyed by (connection_string, database, collection)
+_SCHEMA_CACHE: TTLCache = TTLCache(maxsize=128, ttl=30.0)
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
 
 class MongoConnectionRequest(BaseModel):
     connection_string: str
@@ -33,10 +48,8 @@ DATA_SOURCE_PLUGINS = {
 }
 
 
-@router.get("/plugins")
-async def list_plugins():
-    """List all available data source plugins."""
-    return {
+_PLUGINS = StaticJSON(
+    {
         "plugins": [
             {"id": "local_file", "name": "Local File System"},
             {"id": "s3", "name": "S3 / MinIO"},
@@ -46,16 +59,28 @@ async def list_plugins():
             {"id": "google_drive", "name": "Google Drive"},
         ]
     }
+)
+
+
+@functools.cache
+def _plugin_schema(plugin_id: str) -> StaticJSON:
+    """Encode a plugin's config schema once; it only changes between deploys."""
+    return StaticJSON(DATA_SOURCE_PLUGINS[plugin_id].get_config_schema())
+
+
+@router.get("/plugins")
+async def list_plugins(request: Request):
+    """List all available data source plugins."""
+    return _PLUGINS.response(request)
 
 
 @router.get("/plugins/{plugin_id}/schema")
-async def get_plugin_schema(plugin_id: str):
+async def get_plugin_schema(plugin_id: str, request: Request):
     """Get configuration schema for a specific plugin."""
-    plugin_class = DATA_SOURCE_PLUGINS.get(plugin_id)
-    if not plugin_class:
+    if plugin_id not in DATA_SOURCE_PLUGINS:
         raise HTTPException(status_code=404, detail="Plugin not found")
     try:
-        return plugin_class.get_config_schema()
+        return _plugin_schema(plugin_id).response(request)
     except NotImplementedError:
         raise HTTPException(
             status_code=501, detail="Schema not implemented for this plugin"
@@ -63,12 +88,10 @@ async def get_plugin_schema(plugin_id: str):
 
 
 @router.post("/plugins/mongodb/databases")
-async def list_mongodb_databases(request: MongoConnectionRequest):
+def list_mongodb_databases(request: MongoConnectionRequest):
     """List all databases in a MongoDB instance."""
     try:
-        client: MongoClient[Any] = MongoClient(
-            request.connection_string, serverSelectionTimeoutMS=5000
-        )
+        client = get_mongo_client(request.connection_string)
         databases = client.list_database_names()
         return {"databases": databases}
     except ServerSelectionTimeoutError as e:
@@ -80,15 +103,13 @@ async def list_mongodb_databases(request: MongoConnectionRequest):
 
 
 @router.post("/plugins/mongodb/collections")
-async def list_mongodb_collections(request: MongoConnectionRequest):
+def list_mongodb_collections(request: MongoConnectionRequest):
     """List all collections in a MongoDB database."""
     if not request.database:
         raise HTTPException(status_code=400, detail="Missing database parameter")
 
     try:
-        client: MongoClient[Any] = MongoClient(
-            request.connection_string, serverSelectionTimeoutMS=5000
-        )
+        client = get_mongo_client(request.connection_string)
         db = client[request.database]
         collections = db.list_collection_names()
         return {"collections": collections}
@@ -100,7 +121,7 @@ async def list_mongodb_collections(request: MongoConnectionRequest):
 
 
 @router.get("/mongodb/schema")
-async def get_mongodb_schema(
+def get_mongodb_schema(
     connection_string: str = Query(...),
     database: str = Query(...),
     collection: str = Query(...),
@@ -108,9 +129,16 @@ async def get_mongodb_schema(
     """
     Analyze schema from a MongoDB collection using aggregation pipeline.
     Uses MongoDB's native aggregation for efficient schema analysis.
+    Results are memoized for a short TTL per collection.
     """
+    key = (connection_string, database, collection)
+    with _SCHEMA_CACHE_LOCK:
+        cached = _SCHEMA_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        client: MongoClient[Any] = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+        client = get_mongo_client(connection_string)
         db = client[database]
         coll = db[collection]
 
@@ -124,27 +152,8 @@ async def get_mongodb_schema(
         # Sample size: up to 100 documents or all if less
         sample_size = min(100, doc_count)
 
-        # MongoDB aggregation pipeline for schema analysis
-        # This is inspired by the analyze-schema snippet
-        pipeline = [
-            {"$sample": {"size": sample_size}},
-            {"$project": {"arrayofkeyvalue": {"$objectToArray": "$$ROOT"}}},
-            {"$unwind": "$arrayofkeyvalue"},
-            {
-                "$group": {
-                    "_id": None,
-                    "allkeys": {"$addToSet": "$arrayofkeyvalue.k"},
-                }
-            },
-        ]
-
-        # Get all unique keys
-        result = list(coll.aggregate(pipeline))
-        all_keys = result[0]["allkeys"] if result else []
-
-        # Analyze field types and presence for each key
-        # Sample documents to analyze types
-        sample_docs = list(coll.aggregate([{"$sample": {"size": sample_size}}]))
+        # Sample documents to analyze field types and presence
+        sample_docs = sample_documents(coll, sample_size)
 
         # Analyze schema using MongoDB analyze-schema style
         schema_entries = analyze_schema(sample_docs, max_depth=10)
@@ -157,19 +166,73 @@ async def get_mongodb_schema(
         if sample_doc:
             sample_doc = convert_objectid_to_str(sample_doc)
 
-        return {
+        result = {
             "schema": schema_entries,
             "totalDocuments": doc_count,
             "sampledDocuments": sample_size,
             "sampleDocument": sample_doc,
         }
+        with _SCHEMA_CACHE_LOCK:
+            _SCHEMA_CACHE[key] = result
+        return result
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/mongodb/bootstrap")
+def get_mongodb_bootstrap(
+    connection_string: str = Query(...),
+    database: str | None = Query(None),
+    collection: str | None = Query(None),
+):
+    """
+    Everything the schema picker needs in one request: databases, the collections of
+    each database and, if database and collection are given, a sampled schema.
+    The MongoDB calls are independent, so they run concurrently on a thread pool.
+    """
+    try:
+        client = get_mongo_client(connection_string)
+
+        def sample_schema(db_name: str, coll_name: str) -> list[dict[str, Any]]:
+            sample_docs = sample_documents(client[db_name][coll_name], 100)
+            return convert_objectid_to_str(analyze_schema(sample_docs, max_depth=10))
+
+        schema_future = (
+            _MONGO_POOL.submit(sample_schema, database, collection)
+            if database and collection
+            else None
+        )
+
+        databases = client.list_database_names()
+        collection_futures = {
+            name: _MONGO_POOL.submit(client[name].list_collection_names) for name in databases
+        }
+
+        collections_by_db: dict[str, list[str]] = {}
+        errors: dict[str, str] = {}
+        for name, future in collection_futures.items():
+            try:
+                collections_by_db[name] = future.result()
+            except Exception as e:
+                collections_by_db[name] = []
+                errors[name] = str(e)
+
+        return {
+            "databases": databases,
+            "collections_by_db": collections_by_db,
+            "sample_schema": schema_future.result() if schema_future else None,
+            "errors": errors,
+        }
+    except ServerSelectionTimeoutError as e:
+        error_msg = "Connection Timeout. MongoDB is not reachable."
+        raise HTTPException(status_code=500, detail=error_msg) from e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
 @router.post("/mongodb/schemas-batch")
-async def get_mongodb_schemas_batch(request: dict[str, Any]):
+def get_mongodb_schemas_batch(request: dict[str, Any]):
     """
     Analyze schemas from multiple MongoDB collections in a single request.
     Returns a dictionary with collection names as keys and their schemas as values.
@@ -185,7 +248,7 @@ async def get_mongodb_schemas_batch(request: dict[str, Any]):
                 detail="connection_string, database, and collections are required",
             )
 
-        client: MongoClient[Any] = MongoClient(connection_string, serverSelectionTimeoutMS=5000)
+        client = get_mongo_client(connection_string)
         db = client[database]
 
         results = {}
@@ -209,24 +272,8 @@ async def get_mongodb_schemas_batch(request: dict[str, Any]):
                 # Sample size: up to 50 documents for batch processing (less than single query)
                 sample_size = min(50, doc_count)
 
-                # MongoDB aggregation pipeline for schema analysis
-                pipeline = [
-                    {"$sample": {"size": sample_size}},
-                    {"$project": {"arrayofkeyvalue": {"$objectToArray": "$$ROOT"}}},
-                    {"$unwind": "$arrayofkeyvalue"},
-                    {
-                        "$group": {
-                            "_id": None,
-                            "allkeys": {"$addToSet": "$arrayofkeyvalue.k"},
-                        }
-                    },
-                ]
-
-                # Get all unique keys (used for validation if needed)
-                result = list(coll.aggregate(pipeline))
-
                 # Sample documents to analyze types
-                sample_docs = list(coll.aggregate([{"$sample": {"size": sample_size}}]))
+                sample_docs = sample_documents(coll, sample_size)
 
                 # Analyze schema using MongoDB analyze-schema style
                 schema_entries = analyze_schema(sample_docs, max_depth=10)
@@ -253,6 +300,14 @@ async def get_mongodb_schemas_batch(request: dict[str, Any]):
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+def sample_documents(coll: Any, size: int) -> list[dict[str, Any]]:
+    """
+    Random sample of documents via one `$sample` aggregation, bounded by maxTimeMS.
+    Field paths are derived from the sample itself by analyze_schema.
+    """
+    return list(coll.aggregate([{"$sample": {"size": size}}], maxTimeMS=SAMPLE_MAX_TIME_MS))
+
+
 def convert_objectid_to_str(obj: Any) -> Any:
     """Recursively convert ObjectId instances to strings in nested structures."""
     if isinstance(obj, ObjectId):
@@ -287,6 +342,17 @@ def get_value_type(value: Any) -> str:
         return type(value).__name__
 
 
+def _push_children(stack: list[tuple[str, Any, int]], path_str: str, value: Any, depth: int):
+    """Queue the fields of a nested object for analyze_schema's walk."""
+    # Descend ONLY into direct objects (NOT into arrays, which are just registered)
+    if not isinstance(value, dict):
+        return
+    for key, nested_value in value.items():
+        if depth == 0 and key.startswith("$"):
+            continue
+        stack.append((sys.intern(f"{path_str}.{key}"), nested_value, depth + 1))
+
+
 def analyze_schema(documents: list[dict[str, Any]], max_depth: int = 10) -> list[dict[str, Any]]:
     """
     Analyze MongoDB collection schema similar to MongoDB analyze-schema snippet.
@@ -302,40 +368,23 @@ def analyze_schema(documents: list[dict[str, Any]], max_depth: int = 10) -> list
 
     total_docs = len(documents)
 
-    def analyze_value(doc_id: int, path: list[str], value: Any, depth: int = 0) -> None:
-        """Recursively analyze a value."""
-        if depth >= max_depth:
-            return
-
-        path_str = ".".join(path)
-
-        # Register that this document has this field
-        field_document_ids[path_str].add(doc_id)
-
-        # Determine the type
-        value_type = get_value_type(value)
-
-        # Count the type
-        field_type_counts[path_str][value_type] += 1
-
-        # Recurse ONLY into direct objects (NOT into arrays)
-        if isinstance(value, dict) and value:
-            for key, nested_value in value.items():
-                if depth == 0 and key.startswith("$"):
-                    continue
-                analyze_value(doc_id, [*path, key], nested_value, depth + 1)
-
-        # For arrays, do NOT analyze their content (just register as Array)
-
-    # Analyze all documents
+    # Analyze all documents, walking nested objects with an explicit stack of
+    # (path, value, depth) instead of one recursive call per field
     for doc_id, doc in enumerate(documents):
         if not isinstance(doc, dict):
             continue
 
-        for key, value in doc.items():
-            if key.startswith("$"):
+        stack = [(key, value, 0) for key, value in doc.items() if not key.startswith("$")]
+        while stack:
+            path_str, value, depth = stack.pop()
+            if depth >= max_depth:
                 continue
-            analyze_value(doc_id, [key], value, depth=0)
+
+            # Register that this document has this field, and count its type
+            field_document_ids[path_str].add(doc_id)
+            field_type_counts[path_str][get_value_type(value)] += 1
+
+            _push_children(stack, path_str, value, depth)
 
     # Generate result
     results = []
@@ -377,47 +426,6 @@ def analyze_schema(documents: list[dict[str, Any]], max_depth: int = 10) -> list
     return results
 
 
-def collect_all_field_paths(
-    documents: list[dict[str, Any]], prefix: str = "", max_depth: int = 10
-) -> set[str]:
-    """
-    Recursively collect all unique field paths from all documents.
-    This is similar to how MongoDB's analyze-schema snippet works.
-    """
-    if not documents or prefix.count(".") >= max_depth:
-        return set()
-
-    all_paths: set[str] = set()
-
-    for doc in documents:
-        if not isinstance(doc, dict):
-            continue
-
-        for key, value in doc.items():
-            # Skip MongoDB internal fields at root level
-            if not prefix and key.startswith("$"):
-                continue
-
-            current_path = f"{prefix}{key}" if prefix else key
-            all_paths.add(current_path)
-
-            # Recursively process nested objects
-            if isinstance(value, dict) and value:  # Only if dict is not empty
-                nested_paths = collect_all_field_paths([value], f"{current_path}.", max_depth)
-                all_paths.update(nested_paths)
-            # Process arrays
-            elif isinstance(value, list) and value:  # Only if list is not empty
-                # Collect all unique objects from the array
-                objects_in_array = [item for item in value if isinstance(item, dict)]
-                if objects_in_array:
-                    nested_paths = collect_all_field_paths(
-                        objects_in_array, f"{current_path}.", max_depth
-                    )
-                    all_paths.update(nested_paths)
-
-    return all_paths
-
-
 def analyze_field_path(field_path: str, documents: list[dict[str, Any]]) -> dict[str, Any]:
     """
     Analyze a specific field path across all documents.
@@ -11,12 +11,13 @@ from ...infrastructure.adapters.data_sources.mongodb import MongoDBAdapter
 from ...infrastructure.adapters.data_sources.s3 import S3Adapter
 from ...infrastructure.adapters.data_sources.sql import SQLAdapter
 from ...infrastructure.adapters.data_sources.web_scraper import WebScraperAdapter
-from ...infrastructure.persistence.opensearch_store import OpenSearchStore
+from ...infrastructure.persistence.opensearch_store import AsyncOpenSearchStore
+from ..responses import ORJSONResponse
 
 router = APIRouter()
 
 # Initialize OpenSearch storage for data sources
-sources_store = OpenSearchStore("marie_rag_indexing_sources")
+sources_store = AsyncOpenSearchStore("marie_rag_indexing_sources")
 
 
 class SourceCreate(BaseModel):
@@ -49,17 +50,26 @@ DATA_SOURCE_PLUGINS = {
 @router.get("/sources")
 async def get_sources():
     """Get all configured data sources."""
-    sources = sources_store.list()
+    sources = await sources_store.list()
     return {"sources": sources}
 
 
+@router.get("/sources/{source_id}")
+async def get_source(source_id: str):
+    """Get a specific data source configuration."""
+    source = await sources_store.get(source_id)
+    if not source:
+        raise HTTPException(status_code=404, detail="Source not found")
+    return source
+
+
 @router.post("/sources")
 async def add_source(source: SourceCreate):
     """Add a new data source configuration."""
     import uuid
 
     source_id = str(uuid.uuid4())
-    new_source = sources_store.create(
+    new_source = await sources_store.create(
         source_id,
         {
             "name": source.name,
@@ -72,10 +82,36 @@ async def add_source(source: SourceCreate):
     return new_source
 
 
+@router.post("/sources/bulk")
+async def add_sources(sources: list[SourceCreate]):
+    """Add several data source configurations in one bulk write."""
+    import uuid
+
+    new_sources, failed = await sources_store.bulk_upsert(
+        [
+            (
+                str(uuid.uuid4()),
+                {
+                    "name": source.name,
+                    "source_type": source.type,
+                    "status": "inactive",
+                    "lastRun": "N/A",
+                    "config": source.config,
+                },
+            )
+            for source in sources
+        ]
+    )
+    if failed:
+        # Partial success: report which writes were rejected
+        return ORJSONResponse(status_code=207, content={"sources": new_sources, "failed": failed})
+    return {"sources": new_sources}
+
+
 @router.put("/sources/{source_id}")
 async def update_source(source_id: str, source: SourceUpdate):
     """Update an existing data source configuration."""
-    existing_source = sources_store.get(source_id)
+    existing_source = await sources_store.get(source_id)
     if not existing_source:
         raise HTTPException(status_code=404, detail="Source not found")
 
@@ -88,18 +124,18 @@ async def update_source(source_id: str, source: SourceUpdate):
     if source.status is not None:
         updates["status"] = source.status
 
-    sources_store.update(source_id, updates)
-    return sources_store.get(source_id)
+    # update() returns the stored document, so no follow-up get is needed
+    return await sources_store.update(source_id, updates) or existing_source
 
 
 @router.delete("/sources/{source_id}")
 async def delete_source(source_id: str):
     """Delete a data source configuration."""
-    existing_source = sources_store.get(source_id)
+    existing_source = await sources_store.get(source_id)
     if not existing_source:
         raise HTTPException(status_code=404, detail="Source not found")
 
-    sources_store.delete(source_id)
+    await sources_store.delete(source_id)
     return {"message": "Source deleted successfully"}
 
 
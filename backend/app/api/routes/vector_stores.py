@@ -1,16 +1,20 @@
 """Vector store management endpoints."""
 
+import functools
+import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 
 from ...infrastructure.adapters.vector_stores.milvus import MilvusAdapter
 from ...infrastructure.adapters.vector_stores.opensearch import OpenSearchAdapter
 from ...infrastructure.adapters.vector_stores.pgvector import PGVectorAdapter
 from ...infrastructure.adapters.vector_stores.pinecone import PineconeAdapter
 from ...infrastructure.adapters.vector_stores.qdrant import QdrantAdapter
+from ..responses import StaticJSON
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 VECTOR_STORE_PLUGINS = {
     "opensearch": OpenSearchAdapter,
@@ -21,10 +25,8 @@ VECTOR_STORE_PLUGINS = {
 }
 
 
-@router.get("/vector_stores")
-async def list_vector_stores():
-    """List all available vector store options."""
-    return {
+_VECTOR_STORES = StaticJSON(
+    {
         "vector_stores": [
             {"id": "opensearch", "name": "OpenSearch"},
             {"id": "pinecone", "name": "Pinecone"},
@@ -33,16 +35,28 @@ async def list_vector_stores():
             {"id": "pgvector", "name": "PostgreSQL (pgvector)"},
         ]
     }
+)
+
+
+@functools.cache
+def _vector_store_schema(vs_id: str) -> StaticJSON:
+    """Encode a vector store's config schema once; it only changes between deploys."""
+    return StaticJSON(VECTOR_STORE_PLUGINS[vs_id].get_config_schema())
+
+
+@router.get("/vector_stores")
+async def list_vector_stores(request: Request):
+    """List all available vector store options."""
+    return _VECTOR_STORES.response(request)
 
 
 @router.get("/vector_stores/{vs_id}/schema")
-async def get_vector_store_schema(vs_id: str):
+async def get_vector_store_schema(vs_id: str, request: Request):
     """Get configuration schema for a specific vector store."""
-    vs_class = VECTOR_STORE_PLUGINS.get(vs_id)
-    if not vs_class:
+    if vs_id not in VECTOR_STORE_PLUGINS:
         raise HTTPException(status_code=404, detail="Vector store not found")
     try:
-        return vs_class.get_config_schema()
+        return _vector_store_schema(vs_id).response(request)
     except NotImplementedError:
         raise HTTPException(
             status_code=501, detail="Schema not implemented for this vector store"
@@ -50,36 +64,30 @@ async def get_vector_store_schema(vs_id: str):
 
 
 @router.get("/indices")
-async def list_indices(vector_store: str = Query("opensearch")):
+def list_indices(vector_store: str = Query("opensearch")):
     """List all indices in the selected vector store."""
-    adapter: Any
-    if vector_store == "opensearch":
-        adapter = OpenSearchAdapter()
-    elif vector_store == "pinecone":
-        adapter = PineconeAdapter()
-    else:
+    vs_class: Any = VECTOR_STORE_PLUGINS.get(vector_store)
+    if not vs_class:
         return {"indices": []}
 
     try:
-        indices = adapter.list_indices()
-        return {"indices": indices}
+        indices = vs_class().list_indices()
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e)) from e
+        # Some adapters connect in their constructor; an unreachable store lists nothing
+        logger.warning("Could not list indices of %s: %s", vector_store, e)
+        return {"indices": [], "error": str(e)}
+    return {"indices": indices}
 
 
 @router.delete("/indices/{index_name}")
-async def delete_index(index_name: str, vector_store: str = Query("opensearch")):
+def delete_index(index_name: str, vector_store: str = Query("opensearch")):
     """Delete an index from the selected vector store."""
-    adapter: Any
-    if vector_store == "opensearch":
-        adapter = OpenSearchAdapter()
-    elif vector_store == "pinecone":
-        adapter = PineconeAdapter()
-    else:
+    vs_class: Any = VECTOR_STORE_PLUGINS.get(vector_store)
+    if not vs_class:
         raise HTTPException(status_code=400, detail="Unsupported vector store")
 
     try:
-        adapter.delete_index(index_name)
+        vs_class().delete_index(index_name)
         return {"status": "success"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
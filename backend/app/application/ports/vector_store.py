@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -54,6 +55,31 @@ class VectorStorePort(ABC):
         """Performs a hybrid search (k-NN + BM25) in the index."""
         pass
 
+    async def aindex_chunks(self, index_name: str, chunks: list[Chunk]):
+        """Async variant of index_chunks; runs the sync call in a worker thread by default."""
+        return await asyncio.to_thread(self.index_chunks, index_name, chunks)
+
+    async def asearch(
+        self,
+        index_name: str,
+        query_vector: list[float],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async variant of search; runs the sync call in a worker thread by default."""
+        return await asyncio.to_thread(self.search, index_name, query_vector, k, filters)
+
+    async def aclose(self):
+        """Closes the running loop's async client; a no-op for stores without one."""
+        return None
+
+    def flush(self):
+        """
+        Pushes any buffered writes to the store; a no-op for stores that write directly.
+        Raises if buffered writes failed, so callers don't report an incomplete ingestion.
+        """
+        return None
+
     @abstractmethod
     def list_indices(self) -> list[dict[str, Any]]:
         """Lists all indices/collections in the vector store."""
@@ -1,7 +1,7 @@
-import json
 import logging
 from typing import Any
 
+import orjson
 import requests
 
 
@@ -71,12 +71,12 @@ class ConnectorAssistant:
             )
             response.raise_for_status()
             result = response.json()
-            res_data = json.loads(result["response"])
+            res_data = orjson.loads(result["response"])
             return (
                 res_data if isinstance(res_data, dict) else self._fallback_suggestion(user_prompt)
             )
         except Exception as e:
-            logging.error(f"Assistant error: {e}")
+            logging.error("Assistant error: %s", e)
             # Fallback: simple keyword matching if LLM fails
             return self._fallback_suggestion(user_prompt)
 
@@ -31,10 +31,10 @@ class EmbeddingEngine:
                 dim = self.model.get_sentence_embedding_dimension()
                 self.dimension = dim if dim is not None else 0
                 logging.info(
-                    f"Loaded HuggingFace model: {self.model_name} (Dimension: {self.dimension})"
+                    "Loaded HuggingFace model: %s (Dimension: %s)", self.model_name, self.dimension
                 )
             except Exception as e:
-                logging.error(f"Error loading HuggingFace model {self.model_name}: {e}")
+                logging.error("Error loading HuggingFace model %s: %s", self.model_name, e)
                 raise e
         elif self.provider == "ollama":
             self.base_url = self.config.get("base_url", "http://localhost:11434")
@@ -43,10 +43,10 @@ class EmbeddingEngine:
                 dummy_emb = self._embed_ollama(["test"])
                 self.dimension = len(dummy_emb[0])
                 logging.info(
-                    f"Initialized Ollama model: {self.model_name} (Dimension: {self.dimension})"
+                    "Initialized Ollama model: %s (Dimension: %s)", self.model_name, self.dimension
                 )
             except Exception as e:
-                logging.error(f"Error connecting to Ollama: {e}")
+                logging.error("Error connecting to Ollama: %s", e)
                 # Don't raise here, maybe Ollama is just down
                 self.dimension = 4096  # Default for many llama models
 
@@ -80,7 +80,7 @@ class EmbeddingEngine:
                 response.raise_for_status()
                 embeddings.append(response.json()["embedding"])
             except Exception as e:
-                logging.error(f"Ollama embedding error: {e}")
+                logging.error("Ollama embedding error: %s", e)
                 # Return zero vector as fallback to avoid breaking the whole batch
                 embeddings.append([0.0] * self.dimension)
         return embeddings
@@ -1,23 +1,17 @@
-import logging
+import contextvars
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
 from ...domain.models import Chunk, Document
-from ...infrastructure.logging.log_manager import LogManagerHandler
+from ...infrastructure.logging.log_manager import get_streaming_logger
 from ..ports.data_source import DataSourcePort
 from ..ports.vector_store import VectorStorePort
 from .chunking import ChunkConfig, ChunkingEngine
 from .embeddings import EmbeddingEngine
 
-# Setup logger with LogManagerHandler
-logger = logging.getLogger(__name__)
-if not any(isinstance(h, LogManagerHandler) for h in logger.handlers):
-    handler = LogManagerHandler()
-    handler.setLevel(logging.DEBUG)  # Capture DEBUG and above
-    logger.addHandler(handler)
-    logger.setLevel(logging.DEBUG)
-    logger.propagate = False  # Don't propagate to root logger
+# Logger that also feeds the SSE log stream
+logger = get_streaming_logger(__name__)
 
 
 class IngestionOrchestrator:
@@ -91,14 +85,18 @@ class IngestionOrchestrator:
             # 5. Index in Vector Store
             if chunks_to_index:
                 success, failed = self.vector_store.index_chunks(self.index_name, chunks_to_index)
-                source_name = doc.metadata.get("source", "unknown")
-                msg = f"Indexed {success} chunks from {source_name}. Failed: {failed}"
-                logger.info(msg)
+                logger.info(
+                    "Indexed %s chunks from %s. Failed: %s",
+                    success,
+                    doc.metadata.get("source", "unknown"),
+                    failed,
+                )
                 return int(success)
             return 0
         except Exception as e:
-            msg = f"Error processing document {doc.metadata.get('source', 'unknown')}: {e!s}"
-            logger.error(msg)
+            logger.error(
+                "Error processing document %s: %s", doc.metadata.get("source", "unknown"), e
+            )
             return 0
 
     def run(self):
@@ -118,9 +116,9 @@ class IngestionOrchestrator:
                 total_docs = self.data_source.get_document_count()
                 if total_docs and self.total_callback:
                     self.total_callback(total_docs)
-                    logger.info(f"Total documents to process: {total_docs}")
+                    logger.info("Total documents to process: %s", total_docs)
             except Exception as e:
-                logger.warning(f"Could not get document count: {e}")
+                logger.warning("Could not get document count: %s", e)
 
         doc_count = 0
         chunk_count = 0
@@ -128,7 +126,8 @@ class IngestionOrchestrator:
             if self.execution_mode == "parallel":
                 # Parallel mode with streaming - processes documents as they come from cursor
                 logger.info(
-                    f"🚀 Starting parallel processing with {self.max_workers} workers (streaming mode)"
+                    "🚀 Starting parallel processing with %s workers (streaming mode)",
+                    self.max_workers,
                 )
 
                 with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -139,12 +138,15 @@ class IngestionOrchestrator:
                         doc_count += 1
 
                         # Submit document for processing
-                        future = executor.submit(self._process_document, doc)
+                        # Run in a copy of our context so worker logs keep the job tag
+                        future = executor.submit(
+                            contextvars.copy_context().run, self._process_document, doc
+                        )
                         futures_to_doc_num[future] = doc_count
 
                         # Log queueing progress every 100 documents
                         if doc_count % 100 == 0:
-                            logger.info(f"📄 Queued {doc_count} documents...")
+                            logger.info("📄 Queued %s documents...", doc_count)
 
                         # Wait for some futures to complete if queue is too large
                         # This prevents memory buildup while keeping cursor alive
@@ -162,11 +164,13 @@ class IngestionOrchestrator:
                             # Log every 10 documents
                             if completed_doc_num % 10 == 0:
                                 logger.info(
-                                    f"📊 Documents Processed: {completed_doc_num}\nChunks Created: {chunk_count}"
+                                    "📊 Documents Processed: %s\nChunks Created: %s",
+                                    completed_doc_num,
+                                    chunk_count,
                                 )
 
                     # Process remaining futures after cursor exhausted
-                    logger.info(f"⏳ Processing remaining {len(futures_to_doc_num)} documents...")
+                    logger.info("⏳ Processing remaining %s documents...", len(futures_to_doc_num))
                     for future in as_completed(futures_to_doc_num.keys()):
                         chunks = future.result()
                         chunk_count += chunks
@@ -179,11 +183,15 @@ class IngestionOrchestrator:
                         # Log every 10 documents
                         if completed_doc_num % 10 == 0:
                             logger.info(
-                                f"📊 Documents Processed: {completed_doc_num}\nChunks Created: {chunk_count}"
+                                "📊 Documents Processed: %s\nChunks Created: %s",
+                                completed_doc_num,
+                                chunk_count,
                             )
 
                     logger.info(
-                        f"✅ Parallel processing completed: {doc_count} documents, {chunk_count} chunks"
+                        "✅ Parallel processing completed: %s documents, %s chunks",
+                        doc_count,
+                        chunk_count,
                     )
             else:
                 for doc in self.data_source.load_data():
@@ -198,10 +206,11 @@ class IngestionOrchestrator:
                     # Log progress every 5 documents
                     if doc_count % 5 == 0:
                         logger.info(
-                            f"📊 Documents Processed: {doc_count}\nChunks Created: {chunk_count}"
+                            "📊 Documents Processed: %s\nChunks Created: %s", doc_count, chunk_count
                         )
 
-            # Finalize
+            # Finalize; make sure any buffered chunks reach the store before reporting done
+            self.vector_store.flush()
             msg = (
                 f"✨ Ingestion completed for source: {self.data_source.plugin_id}. "
                 f"Total documents: {doc_count}, Total chunks: {chunk_count}"
@@ -209,5 +218,5 @@ class IngestionOrchestrator:
             logger.info(msg)
             return {"documents": doc_count, "chunks": chunk_count}
         except Exception as e:
-            logger.error(f"❌ Ingestion failed: {e!s}")
+            logger.error("❌ Ingestion failed: %s", e)
             return {"error": str(e)}
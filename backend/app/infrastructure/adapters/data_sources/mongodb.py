@@ -1,21 +1,87 @@
-import logging
+import atexit
+import threading
+from collections import OrderedDict
 from collections.abc import Generator
 from typing import Any
 
+from bson import ObjectId
 from pymongo import MongoClient
 
 from ....application.ports.data_source import DataSourcePort
 from ....domain.models import Document
-from ....infrastructure.logging.log_manager import LogManagerHandler
+from ....infrastructure.logging.log_manager import get_streaming_logger
 
-# Setup logger with LogManagerHandler
-logger = logging.getLogger(__name__)
-if not any(isinstance(h, LogManagerHandler) for h in logger.handlers):
-    handler = LogManagerHandler()
-    handler.setLevel(logging.DEBUG)
-    logger.addHandler(handler)
-    logger.setLevel(logging.DEBUG)
-    logger.propagate = False
+# Logger that also feeds the SSE log stream
+logger = get_streaming_logger(__name__)
+
+# MongoClients are pooled and thread-safe; keep one per connection string (LRU-bounded)
+_MONGO_CLIENTS: OrderedDict[str, MongoClient[Any]] = OrderedDict()
+_MONGO_CLIENTS_LOCK = threading.Lock()
+_MAX_MONGO_CLIENTS = 16
+
+# Documents per server round-trip when streaming a collection (driver default is 101)
+FETCH_BATCH_SIZE = 1000
+
+
+def get_mongo_client(connection_string: str) -> MongoClient[Any]:
+    """Return the shared MongoClient for a connection string, creating it on first use."""
+    with _MONGO_CLIENTS_LOCK:
+        client = _MONGO_CLIENTS.get(connection_string)
+        if client is not None:
+            _MONGO_CLIENTS.move_to_end(connection_string)
+            return client
+
+        # Keyword options override the URI's, so only default what the URI leaves unset
+        options: dict[str, Any] = {"maxPoolSize": 20}
+        if "serverselectiontimeoutms=" not in connection_string.lower():
+            options["serverSelectionTimeoutMS"] = 5000
+        client = MongoClient(connection_string, **options)
+        _MONGO_CLIENTS[connection_string] = client
+        if len(_MONGO_CLIENTS) > _MAX_MONGO_CLIENTS:
+            # Only drop the cache's reference: a running ingestion may still be reading
+            # through the evicted client, which is released once its last user lets go
+            _MONGO_CLIENTS.popitem(last=False)
+        return client
+
+
+@atexit.register
+def _close_mongo_clients() -> None:
+    """Close pooled MongoClients on interpreter shutdown."""
+    with _MONGO_CLIENTS_LOCK:
+        while _MONGO_CLIENTS:
+            _, client = _MONGO_CLIENTS.popitem()
+            client.close()
+
+
+def _get_nested_value(doc: Any, path: str) -> Any:
+    """Extract value from nested path, handling arrays."""
+    parts = path.split(".")
+    current = doc
+    for part in parts:
+        if isinstance(current, dict):
+            current = current.get(part)
+        elif isinstance(current, list):
+            # If it's a list, try to extract the field from all items
+            if part.isdigit():
+                # Specific index like titles.0.title
+                idx = int(part)
+                if idx < len(current):
+                    current = current[idx]
+                else:
+                    return None
+            else:
+                # Extract field from all items in array
+                # For example: titles.title will get all title fields from titles array
+                values = []
+                for item in current:
+                    if isinstance(item, dict) and part in item:
+                        values.append(item[part])
+                if values:
+                    return values  # Return list of values
+                return None
+        else:
+            return None
+    return current
 
 
 class MongoDBAdapter(DataSourcePort):
@@ -58,6 +124,9 @@ class MongoDBAdapter(DataSourcePort):
                 single_field = config.get("content_field", "text")
                 self.content_fields = [single_field] if single_field else []
 
+        # Explicit list of _ids to ingest; fetched in batched $in queries
+        self.document_ids = config.get("document_ids", [])
+
         self.metadata_fields = config.get("metadata_fields", [])
         if not self.metadata_fields:
             # Check for custom_metadata_fields (string with comma-separated values)
@@ -70,7 +139,7 @@ class MongoDBAdapter(DataSourcePort):
         if not self.database_name:
             raise ValueError("database is required for MongoDBAdapter")
 
-        self.client: MongoClient[Any] = MongoClient(self.connection_string)
+        self.client: MongoClient[Any] = get_mongo_client(self.connection_string)
         self.db = self.client[self.database_name]
         if self.collection_name:
             self.collection = self.db[self.collection_name]
@@ -91,6 +160,8 @@ class MongoDBAdapter(DataSourcePort):
             return 0
 
         try:
+            if self.document_ids:
+                return self.collection.count_documents({"_id": {"$in": self._id_keys()}})
             if self.query_mode:
                 if isinstance(self.query, list):  # Aggregation pipeline
                     count_pipeline = self.query.copy()
@@ -102,109 +173,127 @@ class MongoDBAdapter(DataSourcePort):
             else:
                 return self.collection.count_documents({})
         except Exception as e:
-            logger.warning(f"MongoDB: Could not get document count: {e}")
+            logger.warning("MongoDB: Could not get document count: %s", e)
             return 0
 
+    def _projection(self) -> dict[str, int] | None:
+        """Only fetch the top-level fields that content and metadata paths read."""
+        if not self.content_fields:
+            return None
+        projection = {"_id": 1}
+        for path in [*self.content_fields, *self.metadata_fields]:
+            projection[path.split(".")[0]] = 1
+        return projection
+
     def load_data(self) -> Generator[Document, None, None]:
         if not hasattr(self, "collection"):
             logger.warning("MongoDB: No collection configured")
             return
 
+        if self.document_ids:
+            yield from self.load_many(self.document_ids)
+            return
+
         try:
-            logger.info(f"MongoDB: Starting data load from collection '{self.collection.name}'")
-            logger.info(f"MongoDB: Query mode: {self.query_mode}, Query: {self.query}")
-            logger.info(f"MongoDB: Content fields: {self.content_fields}")
+            logger.info("MongoDB: Starting data load from collection '%s'", self.collection.name)
+            logger.info("MongoDB: Query mode: %s, Query: %s", self.query_mode, self.query)
+            logger.info("MongoDB: Content fields: %s", self.content_fields)
 
             cursor: Any
-            if self.query_mode:
-                if isinstance(self.query, list):  # Aggregation pipeline
-                    logger.info("MongoDB: Using aggregation pipeline")
-                    cursor = self.collection.aggregate(self.query)
-                else:  # Find query
-                    logger.info("MongoDB: Using find query")
-                    cursor = self.collection.find(self.query)
+            if self.query_mode and isinstance(self.query, list):  # Aggregation pipeline
+                logger.info("MongoDB: Using aggregation pipeline")
+                cursor = self.collection.aggregate(self.query, batchSize=FETCH_BATCH_SIZE)
             else:
-                logger.info("MongoDB: Loading all documents (no query)")
-                cursor = self.collection.find({})
-
-            doc_count = 0
-
-            def get_nested_value(doc, path):
-                """Extract value from nested path, handling arrays."""
-                parts = path.split(".")
-                current = doc
-                for part in parts:
-                    if isinstance(current, dict):
-                        current = current.get(part)
-                    elif isinstance(current, list):
-                        # If it's a list, try to extract the field from all items
-                        if part.isdigit():
-                            # Specific index like titles.0.title
-                            idx = int(part)
-                            if idx < len(current):
-                                current = current[idx]
-                            else:
-                                return None
-                        else:
-                            # Extract field from all items in array
-                            # For example: titles.title will get all title fields from titles array
-                            values = []
-                            for item in current:
-                                if isinstance(item, dict) and part in item:
-                                    values.append(item[part])
-                            if values:
-                                return values  # Return list of values
-                            return None
-                    else:
-                        return None
-                return current
-
-            for item in cursor:
-                doc_count += 1
-                # Collect content from all content_fields
-                content_parts = []
-                for field_path in self.content_fields:
-                    field_value = get_nested_value(item, field_path)
-                    if field_value:
-                        # Handle list of values (e.g., from arrays)
-                        if isinstance(field_value, list):
-                            # Join all values from array
-                            field_value = " | ".join(str(v) for v in field_value if v)
-                        if field_value:
-                            content_parts.append(f"{field_path}: {field_value}")
-
-                if not content_parts:
-                    if doc_count % 100 == 0:  # Log every 100 empty docs to avoid spam
-                        logger.warning(
-                            f"MongoDB: Document {doc_count} has no content in fields {self.content_fields}"
-                        )
-                    continue
-
-                # Concatenate all content fields
-                content = "\n\n".join(content_parts)
-
-                metadata = {
-                    "source": (
-                        f"mongodb://{self.database_name}/{self.collection_name}/"
-                        f"{item.get('_id', 'unknown')}"
-                    ),
-                    "id": str(item.get("_id", "")),
-                }
-
-                for field in self.metadata_fields:
-                    val = get_nested_value(item, field)
-                    if val is not None:
-                        metadata[field] = val
-
-                yield Document(
-                    content=content, metadata=metadata, source_id=str(item.get("_id", ""))
+                if self.query_mode:  # Find query
+                    logger.info("MongoDB: Using find query")
+                    query = self.query
+                else:
+                    logger.info("MongoDB: Loading all documents (no query)")
+                    query = {}
+                cursor = self.collection.find(query, projection=self._projection()).batch_size(
+                    FETCH_BATCH_SIZE
                 )
 
-            logger.info(f"MongoDB: Finished loading data. Total documents yielded: {doc_count}")
+            doc_count = yield from self._iter_documents(cursor)
+            logger.info("MongoDB: Finished loading data. Total documents yielded: %s", doc_count)
         except Exception as e:
-            logger.error(f"MongoDB: Error fetching data from MongoDB: {e}")
+            logger.error("MongoDB: Error fetching data from MongoDB: %s", e)
             raise
 
+    def load_many(self, ids: list[Any]) -> Generator[Document, None, None]:
+        """Load documents by _id, fetching up to FETCH_BATCH_SIZE of them per $in query."""
+        if not hasattr(self, "collection"):
+            logger.warning("MongoDB: No collection configured")
+            return
+
+        keys = self._id_keys(ids)
+        logger.info(
+            "MongoDB: Loading %d documents by id from collection '%s'",
+            len(keys),
+            self.collection.name,
+        )
+        doc_count = 0
+        for start in range(0, len(keys), FETCH_BATCH_SIZE):
+            cursor = self.collection.find(
+                {"_id": {"$in": keys[start : start + FETCH_BATCH_SIZE]}},
+                projection=self._projection(),
+            ).batch_size(FETCH_BATCH_SIZE)
+            doc_count += yield from self._iter_documents(cursor, doc_count)
+        logger.info("MongoDB: Finished loading data. Total documents yielded: %d", doc_count)
+
+    def _id_keys(self, ids: list[Any] | None = None) -> list[Any]:
+        # Hex strings are stored as ObjectIds; anything else is matched as-is
+        return [
+            ObjectId(i) if isinstance(i, str) and ObjectId.is_valid(i) else i
+            for i in (self.document_ids if ids is None else ids)
+        ]
+
+    def _iter_documents(self, cursor: Any, doc_count: int = 0) -> Generator[Document, None, int]:
+        """Convert raw MongoDB documents to Documents; returns how many were read."""
+        start_count = doc_count
+        for item in cursor:
+            doc_count += 1
+            # Collect content from all content_fields
+            content_parts = []
+            for field_path in self.content_fields:
+                field_value = _get_nested_value(item, field_path)
+                if field_value:
+                    # Handle list of values (e.g., from arrays)
+                    if isinstance(field_value, list):
+                        # Join all values from array
+                        field_value = " | ".join(str(v) for v in field_value if v)
+                    if field_value:
+                        content_parts.append(f"{field_path}: {field_value}")
+
+            if not content_parts:
+                if doc_count % 100 == 0:  # Log every 100 empty docs to avoid spam
+                    logger.warning(
+                        "MongoDB: Document %s has no content in fields %s",
+                        doc_count,
+                        self.content_fields,
+                    )
+                continue
+
+            # Concatenate all content fields
+            content = "\n\n".join(content_parts)
+
+            metadata = {
+                "source": (
+                    f"mongodb://{self.database_name}/{self.collection_name}/"
+                    f"{item.get('_id', 'unknown')}"
+                ),
+                "id": str(item.get("_id", "")),
+            }
+
+            for field in self.metadata_fields:
+                val = _get_nested_value(item, field)
+                if val is not None:
+                    metadata[field] = val
+
+            yield Document(content=content, metadata=metadata, source_id=str(item.get("_id", "")))
+
+        return doc_count - start_count
+
     @staticmethod
     def get_config_schema() -> dict[str, Any]:
         return {
@@ -239,6 +328,13 @@ class MongoDBAdapter(DataSourcePort):
                     "items": {"type": "string"},
                     "default": [],
                 },
+                "document_ids": {
+                    "type": "array",
+                    "title": "Document IDs",
+                    "description": "Only ingest the documents with these _id values",
+                    "items": {"type": "string"},
+                    "default": [],
+                },
                 "query_mode": {
                     "type": "boolean",
                     "title": "Advanced Query Mode",
@@ -1,4 +1,6 @@
-from collections.abc import Generator
+from collections import deque
+from collections.abc import Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import boto3
@@ -38,6 +40,8 @@ class S3Adapter(DataSourcePort):
         self.aws_access_key_id = config.get("aws_access_key_id")
         self.aws_secret_access_key = config.get("aws_secret_access_key")
         self.region_name = config.get("region_name", "us-east-1")
+        # Objects downloaded in parallel
+        self.concurrency = int(config.get("concurrency", 16))
 
         self.s3 = boto3.client(
             "s3",
@@ -52,33 +56,44 @@ class S3Adapter(DataSourcePort):
             paginator = self.s3.get_paginator("list_objects_v2")
             pages = paginator.paginate(Bucket=self.bucket_name, Prefix=self.prefix)
 
-            for page in pages:
-                if "Contents" not in page:
-                    continue
-
-                for obj in page["Contents"]:
-                    key = obj["Key"]
-                    if key.endswith("/"):  # Skip directories
-                        continue
-
-                    # Download object
-                    response = self.s3.get_object(Bucket=self.bucket_name, Key=key)
-                    content = response["Body"].read().decode("utf-8", errors="ignore")
-
-                    yield Document(
-                        content=content,
-                        metadata={
-                            "source": f"s3://{self.bucket_name}/{key}",
-                            "bucket": self.bucket_name,
-                            "key": key,
-                            "size": obj["Size"],
-                            "last_modified": str(obj["LastModified"]),
-                        },
-                        source_id=self.config.get("id", "unknown"),
-                    )
+            # boto3 clients are thread-safe; download concurrently, in listing order, with at
+            # most `concurrency` bodies fetched ahead of the consumer
+            with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="s3") as pool:
+                pending: deque[Future[Document]] = deque()
+                for obj in self._objects(pages):
+                    if len(pending) >= self.concurrency:
+                        yield pending.popleft().result()
+                    pending.append(pool.submit(self._fetch_object, obj))
+                while pending:
+                    yield pending.popleft().result()
         except Exception as e:
             print(f"Error fetching data from S3: {e}")
 
+    @staticmethod
+    def _objects(pages: Iterable[dict[str, Any]]) -> Generator[dict[str, Any], None, None]:
+        """Listed objects across pages, skipping directory markers."""
+        for page in pages:
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith("/"):
+                    yield obj
+
+    def _fetch_object(self, obj: dict[str, Any]) -> Document:
+        key = obj["Key"]
+        response = self.s3.get_object(Bucket=self.bucket_name, Key=key)
+        content = response["Body"].read().decode("utf-8", errors="ignore")
+
+        return Document(
+            content=content,
+            metadata={
+                "source": f"s3://{self.bucket_name}/{key}",
+                "bucket": self.bucket_name,
+                "key": key,
+                "size": obj["Size"],
+                "last_modified": str(obj["LastModified"]),
+            },
+            source_id=self.config.get("id", "unknown"),
+        )
+
     @staticmethod
     def get_config_schema() -> dict[str, Any]:
         return {
@@ -117,6 +132,14 @@ class S3Adapter(DataSourcePort):
                     "description": "AWS Region (e.g., us-east-1)",
                     "default": "us-east-1",
                 },
+                "concurrency": {
+                    "type": "integer",
+                    "title": "Parallel Downloads",
+                    "description": "How many objects to download at the same time",
+                    "default": 16,
+                    "minimum": 1,
+                    "maximum": 64,
+                },
             },
             "required": ["bucket_name", "aws_access_key_id", "aws_secret_access_key"],
         }
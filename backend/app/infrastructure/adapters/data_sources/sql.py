@@ -1,11 +1,41 @@
+import threading
+from collections import OrderedDict
 from collections.abc import Generator
 from typing import Any
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, make_url, text
 
 from ....application.ports.data_source import DataSourcePort
 from ....domain.models import Document
 
+# Engines own a connection pool; keep one per connection string (LRU-bounded)
+_ENGINES: OrderedDict[str, Engine] = OrderedDict()
+_ENGINES_LOCK = threading.Lock()
+_MAX_ENGINES = 16
+
+# Rows fetched per round-trip from a server-side cursor
+FETCH_BATCH_SIZE = 1000
+
+
+def get_engine(connection_string: str) -> Engine:
+    """Return the shared Engine for a connection string, creating it on first use."""
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(connection_string)
+        if engine is not None:
+            _ENGINES.move_to_end(connection_string)
+            return engine
+
+        options: dict[str, Any] = {"pool_pre_ping": True}
+        # SQLite uses single-connection pools that take no sizing arguments
+        if make_url(connection_string).get_backend_name() != "sqlite":
+            options.update(pool_size=10, max_overflow=20)
+        engine = create_engine(connection_string, **options)
+        _ENGINES[connection_string] = engine
+        if len(_ENGINES) > _MAX_ENGINES:
+            _, evicted = _ENGINES.popitem(last=False)
+            evicted.dispose()
+        return engine
+
 
 class SQLAdapter(DataSourcePort):
     """
@@ -30,7 +60,7 @@ class SQLAdapter(DataSourcePort):
         if not self.connection_string:
             raise ValueError("connection_string is required for SQLAdapter")
 
-        self.engine = create_engine(self.connection_string)
+        self.engine = get_engine(self.connection_string)
 
     def validate_config(self) -> bool:
         return all([self.connection_string, self.query])
@@ -48,7 +78,10 @@ class SQLAdapter(DataSourcePort):
             return
 
         try:
-            with self.engine.connect() as connection:
+            # Stream rows through a server-side cursor instead of buffering the result set
+            with self.engine.connect().execution_options(
+                stream_results=True, yield_per=FETCH_BATCH_SIZE
+            ) as connection:
                 result = connection.execute(text(self.query))
                 for row in result:
                     # Convert row to dict
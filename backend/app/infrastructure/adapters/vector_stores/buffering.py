@@ -0,0 +1,160 @@
+import logging
+import threading
+import time
+from typing import Any
+
+from ....application.ports.vector_store import VectorStorePort
+from ....domain.models import Chunk
+
+logger = logging.getLogger(__name__)
+
+
+class BufferingVectorStore(VectorStorePort):
+    """
+    Wraps another vector store and coalesces small index_chunks calls into larger upserts.
+
+    Chunks are buffered per index and handed to the wrapped store once a buffer holds
+    `batch_size` chunks or has waited `flush_interval` seconds. Call flush() to push what
+    is left and surface failed writes; searches flush first so they see everything
+    indexed so far.
+    """
+
+    def __init__(self, store: VectorStorePort, batch_size: int = 1000, flush_interval: float = 0.5):
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buf: dict[str, list[Chunk]] = {}
+        self._buf_since: dict[str, float] = {}
+        self._buf_lock = threading.Lock()
+        # Held from taking a batch out of the buffer until the store has it, so batches reach
+        # the store in the order they were buffered and flush() never returns mid-write.
+        # Always acquired before _buf_lock.
+        self._flush_lock = threading.Lock()
+        self._failed = 0  # chunks that failed since the last flush(); guarded by _flush_lock
+        # Background flusher; only runs while something is buffered
+        self._flusher: threading.Thread | None = None
+
+    def _take(self, index_name: str) -> list[Chunk]:
+        """Swap out an index's buffer; caller must hold _buf_lock."""
+        self._buf_since.pop(index_name, None)
+        return self._buf.pop(index_name, [])
+
+    def _upsert(self, index_name: str, chunks: list[Chunk]):
+        """Hand a batch to the wrapped store; caller must hold _flush_lock."""
+        if not chunks:
+            return
+        try:
+            _, failed = self.store.index_chunks(index_name, chunks)
+        except Exception as e:
+            logger.error("Error flushing %s buffered chunks: %s", len(chunks), e)
+            failed = len(chunks)
+        if failed:
+            logger.warning("%s of %s buffered chunks failed", failed, len(chunks))
+            self._failed += failed
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(self.flush_interval / 2)
+            with self._flush_lock:
+                now = time.monotonic()
+                with self._buf_lock:
+                    due = {
+                        name: self._take(name)
+                        for name, since in list(self._buf_since.items())
+                        if now - since >= self.flush_interval
+                    }
+                    if not self._buf:
+                        self._flusher = None
+                for name, chunks in due.items():
+                    self._upsert(name, chunks)
+            if self._flusher is not threading.current_thread():
+                return
+
+    def _flush_all(self):
+        """Send every buffered chunk to the wrapped store; caller must hold _flush_lock."""
+        with self._buf_lock:
+            pending = {name: self._take(name) for name in list(self._buf)}
+        for name, chunks in pending.items():
+            self._upsert(name, chunks)
+
+    def flush(self):
+        """Send every buffered chunk to the wrapped store.
+
+        Raises RuntimeError if any chunk failed to index since the previous flush().
+        """
+        with self._flush_lock:
+            self._flush_all()
+            failed, self._failed = self._failed, 0
+        if failed:
+            raise RuntimeError(f"{failed} buffered chunks failed to index")
+        self.store.flush()
+
+    def index_chunks(self, index_name: str, chunks: list[Chunk]):
+        with self._buf_lock:
+            buf = self._buf.setdefault(index_name, [])
+            self._buf_since.setdefault(index_name, time.monotonic())
+            buf.extend(chunks)
+            full = len(buf) >= self.batch_size
+            if not full and self._flusher is None:
+                self._flusher = threading.Thread(
+                    target=self._flush_periodically, name="vector-store-flusher", daemon=True
+                )
+                self._flusher.start()
+        if full:
+            with self._flush_lock:
+                with self._buf_lock:
+                    batch = self._take(index_name)
+                self._upsert(index_name, batch)
+        # Failures surface at flush time
+        return len(chunks), 0
+
+    def create_index(
+        self, index_name: str, dimension: int = 384, body: dict[str, Any] | None = None
+    ):
+        return self.store.create_index(index_name, dimension, body)
+
+    def save_checkpoint(self, source_id: str, state: dict[str, Any]):
+        # A checkpoint must not get ahead of the data it describes
+        self.flush()
+        return self.store.save_checkpoint(source_id, state)
+
+    def get_checkpoint(self, source_id: str) -> dict[str, Any] | None:
+        return self.store.get_checkpoint(source_id)
+
+    def search(
+        self,
+        index_name: str,
+        query_vector: list[float],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        with self._flush_lock:
+            self._flush_all()
+        return self.store.search(index_name, query_vector, k, filters)
+
+    def hybrid_search(
+        self,
+        index_name: str,
+        query_text: str,
+        query_vector: list[float],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        with self._flush_lock:
+            self._flush_all()
+        return self.store.hybrid_search(index_name, query_text, query_vector, k, filters)
+
+    def list_indices(self) -> list[dict[str, Any]]:
+        return self.store.list_indices()
+
+    def delete_index(self, index_name: str) -> bool:
+        with self._buf_lock:
+            self._take(index_name)
+        return self.store.delete_index(index_name)
+
+    async def aclose(self):
+        await self.store.aclose()
+
+    @staticmethod
+    def get_config_schema() -> dict[str, Any]:
+        return {"type": "object", "properties": {}}
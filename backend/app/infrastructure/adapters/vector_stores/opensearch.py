@@ -1,11 +1,43 @@
+import asyncio
+import logging
 import os
+from operator import itemgetter
 from typing import Any
 
-from opensearchpy import OpenSearch, helpers
+import orjson
+from opensearchpy import AsyncOpenSearch, OpenSearch, helpers
+from opensearchpy.exceptions import SerializationError
+from opensearchpy.serializer import JSONSerializer
 
 from ....application.ports.vector_store import VectorStorePort
 from ....domain.models import Chunk
 
+logger = logging.getLogger(__name__)
+
+_get_source = itemgetter("_source")
+
+
+class OrjsonSerializer(JSONSerializer):
+    """
+    JSON serializer backed by orjson, much faster on large float arrays (embeddings).
+    """
+
+    def dumps(self, data: Any) -> str:
+        if isinstance(data, str):
+            return data
+        try:
+            return orjson.dumps(
+                data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY
+            ).decode("utf-8")
+        except (ValueError, TypeError) as e:
+            raise SerializationError(data, e) from e
+
+    def loads(self, s: str | bytes) -> Any:
+        try:
+            return orjson.loads(s)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(s, e) from e
+
 
 class OpenSearchAdapter(VectorStorePort):
     """
@@ -18,6 +50,7 @@ class OpenSearchAdapter(VectorStorePort):
         user = self.config.get("user") or os.getenv("OPENSEARCH_USER", "admin")
         password = self.config.get("password") or os.getenv("OPENSEARCH_PASSWORD", "admin")
         self.auth = (user, password)
+        self.url = url
 
         self.client = OpenSearch(
             hosts=[url],
@@ -27,7 +60,41 @@ class OpenSearchAdapter(VectorStorePort):
             verify_certs=False,
             ssl_assert_hostname=False,
             ssl_show_warn=False,
+            serializer=OrjsonSerializer(),
         )
+        # Async clients, one per event loop: aiohttp sessions are bound to the loop that
+        # created them
+        self._aclients: dict[asyncio.AbstractEventLoop, AsyncOpenSearch] = {}
+        self._checkpoint_index_ready = False
+
+    async def _get_aclient(self) -> AsyncOpenSearch:
+        """Get or create the async client used by the a* methods for the running event loop."""
+        loop = asyncio.get_running_loop()
+        # Close clients left behind by loops that have finished
+        for old_loop in [old for old in self._aclients if old.is_closed()]:
+            try:
+                await self._aclients.pop(old_loop).close()
+            except Exception as e:
+                logger.warning("Error closing stale OpenSearch client: %s", e)
+        aclient = self._aclients.get(loop)
+        if aclient is None:
+            aclient = self._aclients[loop] = AsyncOpenSearch(
+                hosts=[self.url],
+                http_compress=True,
+                http_auth=self.auth,
+                use_ssl=False,
+                verify_certs=False,
+                ssl_assert_hostname=False,
+                ssl_show_warn=False,
+                serializer=OrjsonSerializer(),
+            )
+        return aclient
+
+    async def aclose(self):
+        """Close the async client of the running event loop."""
+        aclient = self._aclients.pop(asyncio.get_running_loop(), None)
+        if aclient is not None:
+            await aclient.close()
 
     def create_index(
         self, index_name: str, dimension: int = 384, body: dict[str, Any] | None = None
@@ -57,26 +124,34 @@ class OpenSearchAdapter(VectorStorePort):
         success, failed = helpers.bulk(self.client, actions, refresh=True)
         return success, failed
 
+    async def aindex_chunks(self, index_name: str, chunks: list[Chunk]):
+        actions = [{"_index": index_name, "_source": chunk.model_dump()} for chunk in chunks]
+        success, failed = await helpers.async_bulk(await self._get_aclient(), actions, refresh=True)
+        return success, failed
+
     def save_checkpoint(self, source_id: str, state: dict[str, Any]):
         index_name = "ingestion_checkpoints"
-        self.create_index(
-            index_name,
-            body={
-                "mappings": {
-                    "properties": {
-                        "source_id": {"type": "keyword"},
-                        "last_processed": {"type": "date"},
-                        "state": {"type": "object"},
+        # Only check for the checkpoint index once per adapter instance
+        if not self._checkpoint_index_ready:
+            self.create_index(
+                index_name,
+                body={
+                    "mappings": {
+                        "properties": {
+                            "source_id": {"type": "keyword"},
+                            "last_processed": {"type": "date"},
+                            "state": {"type": "object"},
+                        }
                     }
-                }
-            },
-        )
+                },
+            )
+            self._checkpoint_index_ready = True
 
+        # Checkpoints are fetched by id (realtime GET), so no refresh is needed
         self.client.index(
             index=index_name,
             id=source_id,
             body={"source_id": source_id, "state": state},
-            refresh=True,
         )
 
     def get_checkpoint(self, source_id: str) -> dict[str, Any] | None:
@@ -88,13 +163,10 @@ class OpenSearchAdapter(VectorStorePort):
         except Exception:
             return None
 
-    def search(
-        self,
-        index_name: str,
-        query_vector: list[float],
-        k: int = 5,
-        filters: dict[str, Any] | None = None,
-    ) -> list[dict[str, Any]]:
+    @staticmethod
+    def _knn_query(
+        query_vector: list[float], k: int, filters: dict[str, Any] | None
+    ) -> dict[str, Any]:
         query = {"size": k, "query": {"knn": {"embedding": {"vector": query_vector, "k": k}}}}
 
         if filters:
@@ -106,9 +178,30 @@ class OpenSearchAdapter(VectorStorePort):
                     "filter": filter_list,
                 }
             }
+        return query
 
+    def search(
+        self,
+        index_name: str,
+        query_vector: list[float],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        query = self._knn_query(query_vector, k, filters)
         response = self.client.search(index=index_name, body=query)
-        return [hit["_source"] for hit in response["hits"]["hits"]]
+        return list(map(_get_source, response["hits"]["hits"]))
+
+    async def asearch(
+        self,
+        index_name: str,
+        query_vector: list[float],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        query = self._knn_query(query_vector, k, filters)
+        aclient = await self._get_aclient()
+        response = await aclient.search(index=index_name, body=query)
+        return list(map(_get_source, response["hits"]["hits"]))
 
     def hybrid_search(
         self,
@@ -135,29 +228,23 @@ class OpenSearchAdapter(VectorStorePort):
             query["query"]["bool"]["filter"] = filter_list
 
         response = self.client.search(index=index_name, body=query)
-        return [hit["_source"] for hit in response["hits"]["hits"]]
+        return list(map(_get_source, response["hits"]["hits"]))
 
     def list_indices(self) -> list[dict[str, Any]]:
-        indices_dict = self.client.indices.get_alias()
-        indices = list(indices_dict.keys())  # type: ignore
-        result = []
-        for index in indices:
-            if index.startswith(".") or index == "ingestion_checkpoints":
-                continue
-
-            stats = self.client.indices.stats(index=index)
-            count = stats["_all"]["primaries"]["docs"]["count"]
-            size_bytes = stats["_all"]["primaries"]["store"]["size_in_bytes"]
-
-            result.append(
-                {
-                    "name": index,
-                    "documents": count,
-                    "size": f"{size_bytes / 1024 / 1024:.2f} MB",
-                    "status": "active",
-                }
-            )
-        return result
+        # Single round-trip for all indices instead of one stats call per index
+        rows = self.client.cat.indices(
+            format="json", h="index,docs.count,pri.store.size", bytes="b", s="index"
+        )
+        return [
+            {
+                "name": row["index"],
+                "documents": int(row.get("docs.count") or 0),
+                "size": f"{int(row.get('pri.store.size') or 0) / 1024 / 1024:.2f} MB",
+                "status": "active",
+            }
+            for row in rows
+            if not row["index"].startswith(".") and row["index"] != "ingestion_checkpoints"
+        ]
 
     def delete_index(self, index_name: str) -> bool:
         if self.client.indices.exists(index=index_name):
@@ -1,12 +1,54 @@
+import logging
 import os
+import threading
 import time
+from functools import lru_cache
 from typing import Any
 
+import numpy as np
 from pinecone import Pinecone, ServerlessSpec
 
 from ....application.ports.vector_store import VectorStorePort
 from ....domain.models import Chunk
 
+logger = logging.getLogger(__name__)
+
+_INDEX_NAMES_TTL = 5.0  # seconds to trust a list_indexes() response
+
+# Shared Index handles per (API key, index name, thread pool size)
+_INDEXES: dict[tuple[str, str, int], Any] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def _shared_client(api_key: str) -> Pinecone:
+    """Shared Pinecone client per API key, so adapters reuse one connection pool."""
+    return Pinecone(api_key=api_key)
+
+
+def _shared_index(api_key: str, index_name: str, pool_threads: int) -> Any:
+    """Shared Index handle per (API key, index name, thread pool size)."""
+    key = (api_key, index_name, pool_threads)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index = _INDEXES[key] = _shared_client(api_key).Index(
+                index_name, pool_threads=pool_threads
+            )
+        return index
+
+
+def _drop_index(api_key: str, index_name: str):
+    """Forget and close the handles (and their thread pools) of a deleted index."""
+    with _INDEXES_LOCK:
+        keys = [key for key in _INDEXES if key[:2] == (api_key, index_name)]
+        handles = [_INDEXES.pop(key) for key in keys]
+    for index in handles:
+        try:
+            index.close()
+        except Exception as e:
+            logger.warning("Error closing Pinecone index handle %s: %s", index_name, e)
+
 
 class PineconeAdapter(VectorStorePort):
     """
@@ -15,11 +57,35 @@ class PineconeAdapter(VectorStorePort):
 
     def __init__(self, config: dict[str, Any] | None = None):
         self.config = config or {}
-        api_key = self.config.get("api_key") or os.getenv("PINECONE_API_KEY")
-        self.pc: Pinecone | None = None
-        if api_key:
-            self.pc = Pinecone(api_key=api_key)
-        self.index: Any = None
+        self.api_key: str | None = self.config.get("api_key") or os.getenv("PINECONE_API_KEY")
+        self.pc: Pinecone | None = _shared_client(self.api_key) if self.api_key else None
+        self.batch_size = int(self.config.get("batch_size", 100))
+        self.pool_threads = int(self.config.get("pool_threads", 30))
+        self._indices_cache: tuple[float, list[str]] | None = None
+
+        # Resolve the default index in the background so the first request doesn't pay for it
+        default_index = self.config.get("index_name")
+        if self.api_key and default_index:
+            threading.Thread(target=self._warm_index, args=(default_index,), daemon=True).start()
+
+    def _get_index(self, index_name: str) -> Any:
+        if not self.api_key:
+            raise ValueError("Pinecone API key not configured")
+        return _shared_index(self.api_key, index_name, self.pool_threads)
+
+    def _warm_index(self, index_name: str):
+        try:
+            self._get_index(index_name)
+        except Exception as e:
+            logger.warning("Could not warm Pinecone index %s: %s", index_name, e)
+
+    def _get_index_names(self) -> list[str]:
+        """Index names from the control plane, cached for a few seconds."""
+        assert self.pc is not None
+        now = time.monotonic()
+        if self._indices_cache is None or now - self._indices_cache[0] > _INDEX_NAMES_TTL:
+            self._indices_cache = (now, list(self.pc.list_indexes().names()))
+        return self._indices_cache[1]
 
     def create_index(
         self, index_name: str, dimension: int = 384, body: dict[str, Any] | None = None
@@ -29,42 +95,45 @@ class PineconeAdapter(VectorStorePort):
 
         assert self.pc is not None
 
-        if index_name not in self.pc.list_indexes().names():
+        if index_name not in self._get_index_names():
             cloud = self.config.get("cloud") or os.getenv("PINECONE_CLOUD", "aws")
             region = self.config.get("region") or os.getenv("PINECONE_REGION", "us-east-1")
             spec = ServerlessSpec(cloud=cloud, region=region)  # type: ignore
 
             self.pc.create_index(name=index_name, dimension=dimension, metric="cosine", spec=spec)
+            self._indices_cache = None
 
-            # Wait for index to be ready
+            # Wait for index to be ready, backing off between polls
+            delay = 1.0
             while not self.pc.describe_index(index_name).status["ready"]:
-                time.sleep(1)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 8.0)
 
-        self.index = self.pc.Index(index_name)
+        # Warm the shared handle so the first upsert/query doesn't pay for it
+        self._get_index(index_name)
         return True
 
-    def index_chunks(self, index_name: str, chunks: list[Chunk]):
-        if not self.pc:
-            raise ValueError("Pinecone API key not configured")
-        if not self.index:
-            self.index = self.pc.Index(index_name)
+    def index_chunks(self, index_name: str, chunks: list[Chunk], batch_size: int | None = None):
+        index = self._get_index(index_name)
+        batch_size = batch_size or self.batch_size
 
-        vectors = []
-        for chunk in chunks:
-            vectors.append(
-                {
-                    "id": chunk.chunk_id,
-                    "values": chunk.embedding,
-                    "metadata": {
-                        "content": chunk.content,
-                        "source_id": chunk.source_id,
-                        **chunk.metadata,
-                    },
-                }
+        # (id, values, metadata) tuples are lighter than one dict per vector
+        vectors = [
+            (
+                chunk.chunk_id,
+                chunk.embedding,
+                {"content": chunk.content, "source_id": chunk.source_id, **chunk.metadata},
             )
+            for chunk in chunks
+        ]
 
-        # Pinecone upsert in batches if needed, but for now simple
-        self.index.upsert(vectors=vectors)  # type: ignore
+        # Send fixed-size batches concurrently over the index's thread pool, then wait for all
+        async_results = [
+            index.upsert(vectors=vectors[i : i + batch_size], async_req=True)
+            for i in range(0, len(vectors), batch_size)
+        ]
+        for result in async_results:
+            result.get()
         return len(chunks), 0
 
     def save_checkpoint(self, source_id: str, state: dict[str, Any]):
@@ -81,27 +150,38 @@ class PineconeAdapter(VectorStorePort):
         query_vector: list[float],
         k: int = 5,
         filters: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        if not self.pc:
-            raise ValueError("Pinecone API key not configured")
-        if not self.index:
-            self.index = self.pc.Index(index_name)
+        index = self._get_index(index_name)
 
-        results = self.index.query(  # type: ignore
+        # The Pinecone client only accepts plain lists; convert arrays at the last moment
+        if isinstance(query_vector, np.ndarray):
+            query_vector = query_vector.tolist()
+
+        # Pinecone can't select metadata keys server-side; fields=[] skips metadata entirely
+        results = index.query(
             vector=query_vector,
             top_k=k,
-            include_metadata=True,
+            include_metadata=fields is None or bool(fields),
             filter=filters,
         )
 
         formatted_results = []
         for match in results["matches"]:
+            # Copy so popping the top-level fields leaves the response untouched
+            metadata = match.get("metadata") or {}
+            if fields is None:
+                metadata = dict(metadata)
+            else:
+                metadata = {key: metadata[key] for key in fields if key in metadata}
+            content = metadata.pop("content", "")
+            source_id = metadata.pop("source_id", "")
             formatted_results.append(
                 {
-                    "content": match["metadata"].get("content", ""),
-                    "metadata": {k: v for k, v in match["metadata"].items() if k != "content"},
+                    "content": content,
+                    "metadata": metadata,
                     "embedding": match.get("values"),
-                    "source_id": match["metadata"].get("source_id", ""),
+                    "source_id": source_id,
                     "chunk_id": match["id"],
                 }
             )
@@ -122,17 +202,19 @@ class PineconeAdapter(VectorStorePort):
     def list_indices(self) -> list[dict[str, Any]]:
         if not self.pc:
             return []
-        indexes = self.pc.list_indexes().names()
         return [
             {"name": name, "status": "active", "documents": "N/A", "size": "N/A"}
-            for name in indexes
+            for name in self._get_index_names()
         ]
 
     def delete_index(self, index_name: str) -> bool:
         if not self.pc:
             return False
-        if index_name in self.pc.list_indexes().names():
+        if index_name in self._get_index_names():
             self.pc.delete_index(index_name)
+            self._indices_cache = None
+            assert self.api_key is not None
+            _drop_index(self.api_key, index_name)
             return True
         return False
 
@@ -158,6 +240,25 @@ class PineconeAdapter(VectorStorePort):
                     "description": "Pinecone region (e.g., us-east-1)",
                     "default": "us-east-1",
                 },
+                "index_name": {
+                    "type": "string",
+                    "title": "Default Index",
+                    "description": "Index to open at startup (optional)",
+                },
+                "batch_size": {
+                    "type": "integer",
+                    "title": "Upsert Batch Size",
+                    "description": "Vectors per upsert request",
+                    "default": 100,
+                    "minimum": 1,
+                },
+                "pool_threads": {
+                    "type": "integer",
+                    "title": "Upsert Threads",
+                    "description": "Number of upsert requests sent in parallel",
+                    "default": 30,
+                    "minimum": 1,
+                },
             },
             "required": ["api_key"],
         }
@@ -1,7 +1,92 @@
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
 
 import requests
+from cachetools import TLRUCache, TTLCache, cached
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session so repeated searches reuse TCP/TLS connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=8, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2)
+)
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="model-search")
+
+# Typeahead searches repeat the same queries; local Ollama tags expire quickly
+# so newly pulled models show up. Failures raise and are not cached.
+_HF_CACHE: TTLCache = TTLCache(maxsize=256, ttl=60)
+_OLLAMA_TAGS_CACHE: TTLCache = TTLCache(maxsize=16, ttl=10)
+
+_SEARCH_TTL = {"huggingface": 60.0, "ollama": 10.0, "all": 10.0}
+
+
+def _search_ttu(key: tuple[str, str, str], value: Any, now: float) -> float:
+    # Results that include local Ollama models follow the tags cache's shorter lifetime
+    return now + _SEARCH_TTL[key[0]]
+
+
+# Merged results per (provider, query, base_url), so typeahead repeats skip the merge entirely
+_SEARCH_CACHE: TLRUCache = TLRUCache(maxsize=512, ttu=_search_ttu)
+_SEARCH_CACHE_LOCK = threading.Lock()
+# Uncached searches being fetched right now; identical concurrent calls wait on them
+_IN_FLIGHT: dict[tuple[str, str, str], Future] = {}
+
+# Popular models from the Ollama library (static list for now); names are lowercase
+_POPULAR_OLLAMA = (
+    "llama3",
+    "llama3:8b",
+    "llama3:70b",
+    "mistral",
+    "mixtral",
+    "phi3",
+    "nomic-embed-text",
+    "mxbai-embed-large",
+    "gemma",
+    "gemma:2b",
+    "gemma:7b",
+    "command-r",
+    "command-r-plus",
+    "qwen",
+    "llava",
+)
+
+
+@cached(cache=_HF_CACHE, key=lambda query, limit: (query.lower(), limit), lock=threading.Lock())
+def _fetch_huggingface(query: str, limit: int) -> list[dict[str, Any]]:
+    url = "https://huggingface.co/api/models"
+    params: dict[str, Any] = {
+        "search": query,
+        "filter": "sentence-similarity",
+        "sort": "downloads",
+        "direction": -1,
+        "limit": limit,
+    }
+    response = _SESSION.get(url, params=params, timeout=10)
+    response.raise_for_status()
+    return [
+        {
+            "id": m["modelId"],
+            "name": m["modelId"],
+            "downloads": m.get("downloads", 0),
+            "likes": m.get("likes", 0),
+            "provider": "huggingface",
+        }
+        for m in response.json()
+    ]
+
+
+@cached(cache=_OLLAMA_TAGS_CACHE, lock=threading.Lock())
+def _fetch_local_ollama(base_url: str) -> list[str]:
+    """Names of the models installed on an Ollama server."""
+    response = _SESSION.get(f"{base_url}/api/tags", timeout=5)
+    response.raise_for_status()
+    return [m["name"] for m in response.json().get("models", [])]
 
 
 def search_huggingface_models(query: str, limit: int = 10) -> list[dict[str, Any]]:
@@ -10,33 +95,10 @@ def search_huggingface_models(query: str, limit: int = 10) -> list[dict[str, Any
     Filters for sentence-similarity and feature-extraction.
     """
     try:
-        # Search for sentence-similarity models
-        url = "https://huggingface.co/api/models"
-        params: dict[str, Any] = {
-            "search": query,
-            "filter": "sentence-similarity",
-            "sort": "downloads",
-            "direction": -1,
-            "limit": limit,
-        }
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        models = response.json()
-
-        results = []
-        for m in models:
-            results.append(
-                {
-                    "id": m["modelId"],
-                    "name": m["modelId"],
-                    "downloads": m.get("downloads", 0),
-                    "likes": m.get("likes", 0),
-                    "provider": "huggingface",
-                }
-            )
-        return results
+        # Search for sentence-similarity models; copy so callers can't mutate the cache
+        return [dict(model) for model in _fetch_huggingface(query, limit)]
     except Exception as e:
-        logging.error(f"Error searching Hugging Face: {e}")
+        logging.error("Error searching Hugging Face: %s", e)
         return []
 
 
@@ -50,51 +112,93 @@ def search_ollama_models(
     plus a few popular ones if they match.
     """
     results = []
+    q = query.lower()
+    result_ids: set[str] = set()
 
     # 1. Search local models
     try:
-        response = requests.get(f"{base_url}/api/tags", timeout=5)
-        if response.status_code == requests.codes.ok:
-            local_models = response.json().get("models", [])
-            for m in local_models:
-                name = m["name"]
-                if query.lower() in name.lower():
-                    results.append(
-                        {
-                            "id": name,
-                            "name": f"{name} (Local)",
-                            "provider": "ollama",
-                            "installed": True,
-                        }
-                    )
-    except Exception as e:
-        logging.warning(f"Could not connect to local Ollama to search models: {e}")
-
-    # 2. Popular models from Ollama library (static list for now)
-    popular_ollama = [
-        "llama3",
-        "llama3:8b",
-        "llama3:70b",
-        "mistral",
-        "mixtral",
-        "phi3",
-        "nomic-embed-text",
-        "mxbai-embed-large",
-        "gemma",
-        "gemma:2b",
-        "gemma:7b",
-        "command-r",
-        "command-r-plus",
-        "qwen",
-        "llava",
-    ]
-
-    for model in popular_ollama:
-        if query.lower() in model.lower():
-            # Avoid duplicates if already in local
-            if not any(r["id"] == model for r in results):
+        for name in _fetch_local_ollama(base_url):
+            if q in name.lower():
+                result_ids.add(name)
                 results.append(
-                    {"id": model, "name": model, "provider": "ollama", "installed": False}
+                    {
+                        "id": name,
+                        "name": f"{name} (Local)",
+                        "provider": "ollama",
+                        "installed": True,
+                    }
                 )
+    except Exception as e:
+        logging.warning("Could not connect to local Ollama to search models: %s", e)
+
+    # 2. Popular models from Ollama library
+    for model in _POPULAR_OLLAMA:
+        # Avoid duplicates if already in local
+        if q in model and model not in result_ids:
+            results.append({"id": model, "name": model, "provider": "ollama", "installed": False})
+            result_ids.add(model)
 
     return results[:10]
+
+
+def search_all(query: str, base_url: str = "http://localhost:11434") -> list[dict[str, Any]]:
+    """
+    Search Hugging Face and Ollama concurrently and merge the results.
+    """
+    futures = [
+        _EXECUTOR.submit(search_huggingface_models, query),
+        _EXECUTOR.submit(search_ollama_models, query, base_url),
+    ]
+    results: list[dict[str, Any]] = []
+    for future in as_completed(futures):
+        results.extend(future.result())
+    return results
+
+
+def search_models(provider: str, query: str, base_url: str) -> list[dict[str, Any]]:
+    """
+    Search one provider ("huggingface", "ollama" or "all"), caching results per
+    (provider, query, base_url). Concurrent identical searches share one upstream
+    fetch. Raises ValueError for an unknown provider.
+    """
+    if provider not in _SEARCH_TTL:
+        raise ValueError(f"Unsupported provider: {provider}")
+    key = (provider, query.lower(), base_url)
+    with _SEARCH_CACHE_LOCK:
+        results = _SEARCH_CACHE.get(key)
+        pending = _IN_FLIGHT.get(key) if results is None else None
+        if results is None and pending is None:
+            # This caller leads: it fetches, everyone else waits on its future
+            future: Future[list[dict[str, Any]]] = Future()
+            _IN_FLIGHT[key] = future
+    if results is not None:
+        return _copy_results(results)
+    if pending is not None:
+        return _copy_results(pending.result())
+
+    try:
+        results = _search_provider(provider, query, base_url)
+        future.set_result(results)
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _SEARCH_CACHE_LOCK:
+            # The provider helpers return [] on errors; don't pin a failure for the whole TTL
+            if results:
+                _SEARCH_CACHE[key] = results
+            del _IN_FLIGHT[key]
+    return _copy_results(results)
+
+
+def _copy_results(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Copy so callers can't mutate the cache
+    return [dict(result) for result in results]
+
+
+def _search_provider(provider: str, query: str, base_url: str) -> list[dict[str, Any]]:
+    if provider == "huggingface":
+        return search_huggingface_models(query)
+    if provider == "ollama":
+        return search_ollama_models(query, base_url)
+    return search_all(query, base_url)
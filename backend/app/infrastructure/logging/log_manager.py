@@ -1,53 +1,115 @@
-import json
 import logging
 import queue
-from collections.abc import Generator
+import threading
+from collections import deque
+from collections.abc import Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import orjson
+
+
+def _sse_frame(log_data: dict) -> bytes:
+    """Encode a log record as a compact Server-Sent Events frame."""
+    return b"data: " + orjson.dumps(log_data) + b"\n\n"
+
+
+# SSE comment sent to idle streams so a disconnected client is noticed and released
+_KEEPALIVE_FRAME = b": keepalive\n\n"
+KEEPALIVE_SECONDS = 15.0
+
+
+def _offer(q: queue.Queue[bytes], frame: bytes) -> None:
+    """Enqueue a frame; a full queue behaves as a ring and drops its oldest frame."""
+    while True:
+        try:
+            q.put_nowait(frame)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+
+# Ingestion job the current code is running for; tagged onto every streamed record
+_current_job_id: ContextVar[str | None] = ContextVar("current_job_id", default=None)
+
+
+@contextmanager
+def job_logging(job_id: str) -> Iterator[None]:
+    """Tag records logged inside the block (in this context) with `job_id`."""
+    token = _current_job_id.set(job_id)
+    try:
+        yield
+    finally:
+        _current_job_id.reset(token)
 
 
 class LogManager:
     def __init__(self):
-        self.listeners: list[queue.Queue[str]] = []
-        self.recent_logs: list[dict] = []  # Store recent logs for late subscribers
+        # Subscriber queue -> job id it follows (None = every job)
+        self.listeners: dict[queue.Queue[bytes], str | None] = {}
         self.max_recent = 50
+        # Store recent logs for late subscribers; the deque drops the oldest in O(1)
+        self.recent_logs: deque[dict] = deque(maxlen=self.max_recent)
+        # Records waiting for fan-out; log() only enqueues so callers never wait on subscribers
+        self._inbox: queue.Queue[dict] = queue.Queue(maxsize=10000)
+        self.dropped = 0  # records discarded because the inbox was full
+        threading.Thread(target=self._drain, name="log-manager-drain", daemon=True).start()
 
-    def subscribe(self) -> queue.Queue[str]:
-        q: queue.Queue[str] = queue.Queue(maxsize=100)
-        self.listeners.append(q)
+    def subscribe(self, job_id: str | None = None) -> queue.Queue[bytes]:
+        q: queue.Queue[bytes] = queue.Queue(maxsize=100)
+        self.listeners[q] = job_id
 
         # Send recent logs to new subscriber
-        for log in self.recent_logs:
-            data = json.dumps(log)
-            try:
-                q.put_nowait(f"data: {data}\n\n")
-            except queue.Full:
-                pass
+        # Snapshot: the drain thread may append while we enqueue
+        for log in tuple(self.recent_logs):
+            if job_id is not None and log.get("job_id") != job_id:
+                continue
+            _offer(q, _sse_frame(log))
 
         return q
 
-    def unsubscribe(self, q: queue.Queue[str]):
-        if q in self.listeners:
-            self.listeners.remove(q)
+    def unsubscribe(self, q: queue.Queue[bytes]):
+        self.listeners.pop(q, None)
 
-    def log(self, message: str, level: str = "info", timestamp: str | None = None):
+    def log(
+        self,
+        message: str,
+        level: str = "info",
+        timestamp: str | None = None,
+        job_id: str | None = None,
+    ):
         from datetime import datetime
 
         if timestamp is None:
             timestamp = datetime.utcnow().isoformat()
 
         log_data = {"message": message, "level": level, "timestamp": timestamp}
+        if job_id is not None:
+            log_data["job_id"] = job_id
+        try:
+            self._inbox.put_nowait(log_data)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self):
+        while True:
+            self._publish(self._inbox.get())
 
+    def _publish(self, log_data: dict):
         # Store in recent logs
         self.recent_logs.append(log_data)
-        if len(self.recent_logs) > self.max_recent:
-            self.recent_logs.pop(0)
 
-        # Send to all subscribers
-        data = json.dumps(log_data)
-        for q in self.listeners:
-            try:
-                q.put_nowait(f"data: {data}\n\n")
-            except queue.Full:
-                pass
+        # Encode once; every subscriber queue holds a reference to the same frame
+        frame = _sse_frame(log_data)
+        # Snapshot so a concurrent subscribe/unsubscribe can't change the set mid-iteration
+        job_id = log_data.get("job_id")
+        for q, wanted in tuple(self.listeners.items()):
+            if wanted is not None and wanted != job_id:
+                continue
+            _offer(q, frame)
 
 
 log_manager = LogManager()
@@ -58,12 +120,30 @@ class LogManagerHandler(logging.Handler):
     def emit(self, record):
         try:
             msg = self.format(record)
-            log_manager.log(msg, level=record.levelname.lower())
+            log_manager.log(msg, level=record.levelname.lower(), job_id=_current_job_id.get())
         except Exception:
             self.handleError(record)
 
 
-def stream_logs(q: queue.Queue) -> Generator[str, None, None]:
-    while True:
-        msg = q.get()
-        yield msg
+def get_streaming_logger(name: str) -> logging.Logger:
+    """Logger whose records go to the SSE log stream; attaches the handler only once."""
+    logger = logging.getLogger(name)
+    if not any(isinstance(h, LogManagerHandler) for h in logger.handlers):
+        handler = LogManagerHandler()
+        handler.setLevel(logging.DEBUG)  # Capture DEBUG and above
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False  # Don't propagate to root logger
+    return logger
+
+
+def stream_logs(q: queue.Queue[bytes]) -> Generator[bytes, None, None]:
+    """Yield pre-encoded frames; unsubscribes once the client goes away."""
+    try:
+        while True:
+            try:
+                yield q.get(timeout=KEEPALIVE_SECONDS)
+            except queue.Empty:
+                yield _KEEPALIVE_FRAME
+    finally:
+        log_manager.unsubscribe(q)
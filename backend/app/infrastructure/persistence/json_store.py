@@ -1,63 +1,116 @@
 """Simple JSON-based persistence for development."""
-import json
+
+import atexit
+import copy
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+FLUSH_DELAY = 0.5  # seconds to batch mutations before writing the file
+
 
 class JSONStore:
-    """Simple JSON file-based storage."""
+    """Simple JSON file-based storage.
 
-    def __init__(self, filename: str):
-        self.data_dir = Path("/app/data")
+    The file is read once into memory; mutations update the in-memory list and
+    are written back after a short debounce (and at interpreter exit).
+    """
+
+    def __init__(self, filename: str, data_dir: str | Path = "/app/data"):
+        self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.filepath = self.data_dir / filename
+        self._cache: list[dict[str, Any]] | None = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._timer: threading.Timer | None = None
         self._ensure_file_exists()
+        atexit.register(self.flush)
 
     def _ensure_file_exists(self):
         """Create file with empty structure if it doesn't exist."""
         if not self.filepath.exists():
-            self.save([])
+            self._write([])
+
+    def _items(self) -> list[dict[str, Any]]:
+        """The live cached list, reading the JSON file on first access; caller holds _lock."""
+        if self._cache is None:
+            try:
+                self._cache = orjson.loads(self.filepath.read_bytes())
+            except Exception as e:
+                logging.error("Error loading from %s: %s", self.filepath, e)
+                self._cache = []
+        return self._cache
 
     def load(self) -> list[dict[str, Any]]:
-        """Load data from JSON file."""
-        try:
-            with open(self.filepath) as f:
-                return json.load(f)
-        except Exception as e:
-            logging.error(f"Error loading from {self.filepath}: {e}")
-            return []
+        """Load data (a copy; mutate through save/add/update/delete)."""
+        with self._lock:
+            return copy.deepcopy(self._items())
 
     def save(self, data: list[dict[str, Any]]):
-        """Save data to JSON file."""
+        """Replace the stored data; the file is written on the next flush."""
+        with self._lock:
+            self._cache = copy.deepcopy(data)
+            self._mark_dirty()
+
+    def flush(self):
+        """Write pending changes to disk."""
+        with self._lock:
+            self._timer = None
+            if not self._dirty or self._cache is None:
+                return
+            self._write(self._cache)
+            self._dirty = False
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self._timer is None:
+            self._timer = threading.Timer(FLUSH_DELAY, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _write(self, data: list[dict[str, Any]]):
+        # Write to a temp file and rename so a crash never leaves a truncated file
+        tmp = self.filepath.with_suffix(".tmp")
         try:
-            with open(self.filepath, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            tmp.write_bytes(
+                orjson.dumps(
+                    data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                )
+            )
+            tmp.replace(self.filepath)
         except Exception as e:
-            logging.error(f"Error saving to {self.filepath}: {e}")
+            logging.error("Error saving to %s: %s", self.filepath, e)
 
     def add(self, item: dict[str, Any]):
         """Add item to store."""
-        data = self.load()
-        data.append(item)
-        self.save(data)
+        with self._lock:
+            self._items().append(copy.deepcopy(item))
+            self._mark_dirty()
 
     def update(self, item_id: str, updates: dict[str, Any], id_field: str = "id"):
         """Update item in store."""
-        data = self.load()
-        for item in data:
-            if str(item.get(id_field)) == str(item_id):
-                item.update(updates)
-                break
-        self.save(data)
+        with self._lock:
+            for item in self._items():
+                if str(item.get(id_field)) == str(item_id):
+                    item.update(updates)
+                    self._mark_dirty()
+                    break
 
     def delete(self, item_id: str, id_field: str = "id"):
         """Delete item from store."""
-        data = self.load()
-        data = [item for item in data if str(item.get(id_field)) != str(item_id)]
-        self.save(data)
+        with self._lock:
+            data = self._items()
+            data[:] = [item for item in data if str(item.get(id_field)) != str(item_id)]
+            self._mark_dirty()
 
     def get(self, item_id: str, id_field: str = "id") -> dict[str, Any] | None:
         """Get item by ID."""
-        data = self.load()
-        return next((item for item in data if str(item.get(id_field)) == str(item_id)), None)
+        with self._lock:
+            item = next(
+                (item for item in self._items() if str(item.get(id_field)) == str(item_id)), None
+            )
+            return copy.deepcopy(item) if item is not None else None
@@ -1,158 +1,534 @@
 """OpenSearch-based configuration store."""
 
+import asyncio
+import copy
 import logging
+import os
+import socket
+import threading
 from datetime import datetime, timezone
 from typing import Any
+from urllib.parse import urlparse
 
+from cachetools import TTLCache
 from fastapi import HTTPException
-from opensearchpy import OpenSearch, exceptions
+from opensearchpy import (
+    AsyncOpenSearch,
+    OpenSearch,
+    Urllib3HttpConnection,
+    exceptions,
+    helpers,
+)
+from urllib3.connection import HTTPConnection
+
+from ..adapters.vector_stores.opensearch import OrjsonSerializer
 
 logger = logging.getLogger(__name__)
 
+_UTC = timezone.utc
+
+# Mapping/settings for every configuration index
+_INDEX_BODY: dict[str, Any] = {
+    "mappings": {
+        "properties": {
+            "id": {"type": "keyword"},
+            "name": {"type": "text"},
+            "created_at": {"type": "date"},
+            "updated_at": {"type": "date"},
+        }
+    },
+    "settings": {
+        "number_of_shards": 1,
+        "number_of_replicas": 0,
+    },
+}
+
+# Short-lived cache for get(), keyed by (index_name, id); writes through either store evict
+_GET_CACHE: TTLCache = TTLCache(maxsize=256, ttl=5.0)
+_GET_CACHE_LOCK = threading.RLock()
+
+# One client (and connection pool) shared by every store in the process
+_CLIENT: OpenSearch | None = None
+_CLIENT_LOCK = threading.Lock()
+
+# Async clients for FastAPI handlers, one per event loop: aiohttp sessions are bound to the
+# loop that created them
+_ACLIENTS: dict[asyncio.AbstractEventLoop, AsyncOpenSearch] = {}
+
+# Indices already checked/created by this process
+_ENSURED: set[str] = set()
+_ENSURED_LOCK = threading.Lock()
+
+_UNAVAILABLE = "Storage service unavailable. Please check OpenSearch connection."
+_BULK_OPTIONS: dict[str, Any] = {
+    "chunk_size": 500,
+    "max_chunk_bytes": 100 * 1024 * 1024,
+    "raise_on_error": False,
+    "refresh": "wait_for",
+}
+
+
+def _connection_kwargs() -> dict[str, Any]:
+    """Connection settings shared by the sync and async clients."""
+    # Parse OPENSEARCH_URL or use individual components
+    opensearch_url = os.getenv("OPENSEARCH_URL", "http://localhost:9200")
+    parsed = urlparse(opensearch_url)
+
+    host = parsed.hostname or "localhost"
+    port = parsed.port or 9200
+    use_ssl = parsed.scheme == "https"
+
+    # Get auth from env
+    username = os.getenv("OPENSEARCH_USER")
+    password = os.getenv("OPENSEARCH_PASSWORD")
+
+    http_auth = (username, password) if username and password else None
+
+    return {
+        "hosts": [{"host": host, "port": port}],
+        "http_auth": http_auth,
+        "use_ssl": use_ssl,
+        "verify_certs": False,
+        "ssl_show_warn": False,
+        "http_compress": True,
+        "retry_on_timeout": True,
+        "max_retries": 3,
+        "serializer": OrjsonSerializer(),
+    }
+
+
+class _KeepAliveConnection(Urllib3HttpConnection):
+    """Urllib3 connection whose pooled sockets send TCP keepalives, so idle connections
+    survive NATs/load balancers instead of being silently dropped and re-opened."""
+
+    def _create_urllib3_pool(self) -> None:
+        super()._create_urllib3_pool()
+        self.pool.conn_kw["socket_options"] = [  # type: ignore[union-attr]
+            *HTTPConnection.default_socket_options,
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+
+
+def _get_shared_client() -> OpenSearch:
+    """Get or create the process-wide OpenSearch client."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = OpenSearch(
+                    **_connection_kwargs(),
+                    connection_class=_KeepAliveConnection,
+                    # Room for every request/ingestion thread to keep its own connection
+                    pool_maxsize=32,
+                )
+    return _CLIENT
+
+
+async def _get_shared_async_client() -> AsyncOpenSearch:
+    """Get or create the AsyncOpenSearch client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    # Close clients left behind by loops that have finished
+    for old_loop in [old for old in _ACLIENTS if old.is_closed()]:
+        try:
+            await _ACLIENTS.pop(old_loop).close()
+        except Exception as e:
+            logger.warning("Error closing stale OpenSearch client: %s", e)
+    client = _ACLIENTS.get(loop)
+    if client is None:
+        client = _ACLIENTS[loop] = AsyncOpenSearch(**_connection_kwargs(), maxsize=32)
+    return client
+
+
+async def close_async_client():
+    """Close the running loop's AsyncOpenSearch client (on application shutdown)."""
+    client = _ACLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
+
+def _page_query(after: list[Any] | None, size: int, fields: list[str] | None) -> dict[str, Any]:
+    """match_all page sorted newest first; id breaks ties so search_after is stable."""
+    body: dict[str, Any] = {
+        "query": {"match_all": {}},
+        "size": size,
+        "sort": [{"created_at": "desc"}, {"id": "asc"}],
+    }
+    if fields is not None:
+        body["_source"] = {"includes": fields}
+    if after is not None:
+        body["search_after"] = list(after)
+    return body
+
+
+def _page_result(
+    response: dict[str, Any], size: int
+) -> tuple[list[dict[str, Any]], list[Any] | None]:
+    hits = response["hits"]["hits"]
+    # A short page is the last one
+    after = hits[-1]["sort"] if len(hits) == size else None
+    return [hit["_source"] for hit in hits], after
+
+
+def _now() -> str:
+    """Current UTC time for created_at/updated_at, at millisecond precision."""
+    return datetime.now(_UTC).isoformat(timespec="milliseconds")
+
+
+def _stamp(id: str, data: dict[str, Any], now: str) -> dict[str, Any]:
+    """A stored document: the data plus its id and timestamps."""
+    return {**data, "id": id, "created_at": now, "updated_at": now}
+
+
+def _bulk_actions(
+    index_name: str, docs: list[tuple[str, dict[str, Any]]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Stamped documents and the bulk index actions that store them."""
+    now = _now()
+    sources = [_stamp(id, data, now) for id, data in docs]
+    actions = [
+        {"_op_type": "index", "_index": index_name, "_id": doc["id"], "_source": doc}
+        for doc in sources
+    ]
+    return sources, actions
+
+
+def _bulk_result(
+    index_name: str,
+    sources: list[dict[str, Any]],
+    success: int,
+    errors: int | list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Evict the written ids and split the documents into stored and rejected ids."""
+    _cache_evict(index_name, *(doc["id"] for doc in sources))
+    # The bulk helpers only return an error count (not the list) with stats_only=True
+    failed = _failed_ids(errors if isinstance(errors, list) else [])
+    logger.info("Bulk indexed %s documents in %s (%s failed)", success, index_name, len(failed))
+    return [doc for doc in sources if doc["id"] not in failed], sorted(failed)
+
+
+def _found_sources(index_name: str, response: dict[str, Any]) -> list[dict[str, Any]]:
+    """_source of every document an mget found, cached like get() results."""
+    docs = [doc for doc in response["docs"] if doc.get("found")]
+    for doc in docs:
+        _cache_put(index_name, doc["_id"], doc["_source"])
+    return [doc["_source"] for doc in docs]
+
+
+def _update_body(data: dict[str, Any]) -> dict[str, Any]:
+    return {"doc": {**data, "updated_at": _now()}}
+
+
+def _write_error(e: Exception, action: str, detail: str) -> HTTPException:
+    """Log a failed write and turn it into the HTTP error the API returns."""
+    if isinstance(e, exceptions.ConnectionError):
+        logger.error("OpenSearch connection error %s: %s", action, e)
+        return HTTPException(status_code=503, detail=_UNAVAILABLE)
+    logger.error("Error %s: %s", action, e)
+    return HTTPException(status_code=500, detail=f"{detail}: {str(e)}")
+
+
+def _failed_ids(errors: list[dict[str, Any]]) -> set[str]:
+    """Ids of the documents a bulk request rejected (errors as returned by helpers.bulk)."""
+    return {item["_id"] for error in errors for item in error.values()}
+
+
+# Cached documents are copied in and out so callers can't mutate what later readers get
+def _cache_get(index_name: str, id: str) -> dict[str, Any] | None:
+    with _GET_CACHE_LOCK:
+        doc = _GET_CACHE.get((index_name, id))
+    return copy.deepcopy(doc) if doc is not None else None
+
+
+def _cache_put(index_name: str, id: str, doc: dict[str, Any]):
+    doc = copy.deepcopy(doc)
+    with _GET_CACHE_LOCK:
+        _GET_CACHE[(index_name, id)] = doc
+
+
+def _cache_evict(index_name: str, *ids: str):
+    with _GET_CACHE_LOCK:
+        for id in ids:
+            _GET_CACHE.pop((index_name, id), None)
+
+
+def _ensure_index(index_name: str):
+    """Ensure a configuration index exists (checked once per process)."""
+    if index_name in _ENSURED:
+        return
+    try:
+        with _ENSURED_LOCK:
+            if index_name in _ENSURED:
+                return
+            # One round-trip: create, treating "already exists" (a 400) as success
+            response = _get_shared_client().indices.create(
+                index=index_name, body=_INDEX_BODY, ignore=400
+            )
+            error = response.get("error")
+            if error is None:
+                logger.info("Created OpenSearch index: %s", index_name)
+            elif error.get("type") != "resource_already_exists_exception":
+                logger.error("Could not create OpenSearch index %s: %s", index_name, error)
+                return
+            _ENSURED.add(index_name)
+    except Exception as e:
+        logger.error("Could not create OpenSearch index: %s", e)
+        # Don't raise - allow app to start even if OpenSearch is not available
+
 
 class OpenSearchStore:
     """Store for managing configuration in OpenSearch."""
 
     def __init__(self, index_name: str = "marie_rag_indexing_settings"):
         self.index_name = index_name
-        self.client: OpenSearch | None = None
         self._ensure_index()
 
     def _get_client(self) -> OpenSearch:
-        """Get or create OpenSearch client."""
-        if self.client is None:
-            import os
-
-            # Parse OPENSEARCH_URL or use individual components
-            opensearch_url = os.getenv("OPENSEARCH_URL", "http://localhost:9200")
-            
-            # Parse URL
-            from urllib.parse import urlparse
-            parsed = urlparse(opensearch_url)
-            
-            host = parsed.hostname or "localhost"
-            port = parsed.port or 9200
-            use_ssl = parsed.scheme == "https"
-            
-            # Get auth from env
-            username = os.getenv("OPENSEARCH_USER")
-            password = os.getenv("OPENSEARCH_PASSWORD")
-            
-            http_auth = (username, password) if username and password else None
-
-            self.client = OpenSearch(
-                hosts=[{"host": host, "port": port}],
-                http_auth=http_auth,
-                use_ssl=use_ssl,
-                verify_certs=False,
-                ssl_show_warn=False,
-            )
-        return self.client
+        """Get the shared OpenSearch client."""
+        return _get_shared_client()
 
     def _ensure_index(self):
         """Ensure the settings index exists."""
-        try:
-            client = self._get_client()
-            if not client.indices.exists(index=self.index_name):
-                client.indices.create(
-                    index=self.index_name,
-                    body={
-                        "mappings": {
-                            "properties": {
-                                "id": {"type": "keyword"},
-                                "name": {"type": "text"},
-                                "created_at": {"type": "date"},
-                                "updated_at": {"type": "date"},
-                            }
-                        },
-                        "settings": {
-                            "number_of_shards": 1,
-                            "number_of_replicas": 0,
-                        },
-                    },
-                )
-                logger.info(f"Created OpenSearch index: {self.index_name}")
-        except Exception as e:
-            logger.error(f"Could not create OpenSearch index: {e}")
-            # Don't raise - allow app to start even if OpenSearch is not available
+        _ensure_index(self.index_name)
 
     def create(self, id: str, data: dict[str, Any]) -> dict[str, Any]:
         """Create a new document."""
         try:
-            client = self._get_client()
-            now = datetime.now(timezone.utc).isoformat()
-            doc = {**data, "id": id, "created_at": now, "updated_at": now}
-
-            client.index(index=self.index_name, id=id, body=doc, refresh=True)
-            logger.info(f"Created document {id} in {self.index_name}")
+            doc = _stamp(id, data, _now())
+            self._get_client().index(index=self.index_name, id=id, body=doc, refresh="wait_for")
+            _cache_evict(self.index_name, id)
+            logger.info("Created document %s in %s", id, self.index_name)
             return doc
-        except exceptions.ConnectionError as e:
-            logger.error(f"OpenSearch connection error creating document {id}: {e}")
-            raise HTTPException(
-                status_code=503, detail="Storage service unavailable. Please check OpenSearch connection."
-            )
         except Exception as e:
-            logger.error(f"Error creating document {id}: {e}")
-            raise HTTPException(status_code=500, detail=f"Error creating document: {str(e)}")
+            raise _write_error(e, f"creating document {id}", "Error creating document") from e
+
+    def bulk_upsert(
+        self, docs: list[tuple[str, dict[str, Any]]]
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Create or replace many documents in one bulk request.
+
+        Returns the documents that were stored and the ids of those OpenSearch rejected.
+        """
+        try:
+            sources, actions = _bulk_actions(self.index_name, docs)
+            success, errors = helpers.bulk(self._get_client(), actions, **_BULK_OPTIONS)
+            return _bulk_result(self.index_name, sources, success, errors)
+        except Exception as e:
+            raise _write_error(e, "in bulk upsert", "Error creating documents") from e
 
     def get(self, id: str) -> dict[str, Any] | None:
         """Get a document by ID."""
         try:
-            client = self._get_client()
-            response = client.get(index=self.index_name, id=id)
-            return response["_source"]
+            cached = _cache_get(self.index_name, id)
+            if cached is not None:
+                return cached
+            response = self._get_client().get(index=self.index_name, id=id)
+            doc: dict[str, Any] = response["_source"]
+            _cache_put(self.index_name, id, doc)
+            return doc
         except exceptions.NotFoundError:
             return None
         except Exception as e:
-            logger.error(f"Error getting document {id}: {e}")
+            logger.error("Error getting document %s: %s", id, e)
             return None
 
+    def mget(self, ids: list[str]) -> list[dict[str, Any]]:
+        """Get several documents in one request, in `ids` order; missing ids are skipped."""
+        try:
+            response = self._get_client().mget(index=self.index_name, body={"ids": ids})
+            return _found_sources(self.index_name, response)
+        except Exception as e:
+            logger.error("Error getting documents %s: %s", ids, e)
+            return []
+
     def update(self, id: str, data: dict[str, Any]) -> dict[str, Any] | None:
         """Update a document."""
         try:
-            client = self._get_client()
-            now = datetime.now(timezone.utc).isoformat()
-            update_data = {**data, "updated_at": now}
-
-            client.update(
+            _cache_evict(self.index_name, id)
+            # _source=True returns the updated document, saving a follow-up get
+            response = self._get_client().update(
                 index=self.index_name,
                 id=id,
-                body={"doc": update_data},
-                refresh=True,
+                body=_update_body(data),
+                refresh="wait_for",
+                _source=True,
             )
-            logger.info(f"Updated document {id} in {self.index_name}")
-            return self.get(id)
+            doc: dict[str, Any] = response["get"]["_source"]
+            # Overwrites any pre-update copy a concurrent get() cached while the write was in flight
+            _cache_put(self.index_name, id, doc)
+            logger.info("Updated document %s in %s", id, self.index_name)
+            return doc
         except exceptions.NotFoundError:
-            logger.warning(f"Document {id} not found for update")
+            logger.warning("Document %s not found for update", id)
             return None
         except Exception as e:
-            logger.error(f"Error updating document {id}: {e}")
+            logger.error("Error updating document %s: %s", id, e)
             return None
 
     def delete(self, id: str) -> bool:
         """Delete a document."""
         try:
-            client = self._get_client()
-            client.delete(index=self.index_name, id=id, refresh=True)
-            logger.info(f"Deleted document {id} from {self.index_name}")
+            _cache_evict(self.index_name, id)
+            self._get_client().delete(index=self.index_name, id=id, refresh="wait_for")
+            # Again: a concurrent get() may have re-cached it before the delete landed
+            _cache_evict(self.index_name, id)
+            logger.info("Deleted document %s from %s", id, self.index_name)
             return True
         except exceptions.NotFoundError:
-            logger.warning(f"Document {id} not found for deletion")
+            logger.warning("Document %s not found for deletion", id)
             return False
         except Exception as e:
-            logger.error(f"Error deleting document {id}: {e}")
+            logger.error("Error deleting document %s: %s", id, e)
             return False
 
-    def list(self) -> list[dict[str, Any]]:
-        """List all documents."""
+    def list_page(
+        self, after: list[Any] | None = None, size: int = 200, fields: list[str] | None = None
+    ) -> tuple[list[dict[str, Any]], list[Any] | None]:
+        """One page of documents, newest first, and the cursor for the next page (or None)."""
+        response = self._get_client().search(
+            index=self.index_name, body=_page_query(after, size, fields)
+        )
+        return _page_result(response, size)
+
+    def list(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List all documents, optionally only the given _source fields."""
+        try:
+            docs: list[dict[str, Any]] = []
+            after = None
+            while True:
+                page, after = self.list_page(after, fields=fields)
+                docs.extend(page)
+                if after is None:
+                    return docs
+        except Exception as e:
+            logger.error("Error listing documents: %s", e)
+            return []
+
+
+class AsyncOpenSearchStore:
+    """Async variant of OpenSearchStore for use from FastAPI handlers."""
+
+    def __init__(self, index_name: str = "marie_rag_indexing_settings"):
+        self.index_name = index_name
+        _ensure_index(self.index_name)
+
+    async def _get_client(self) -> AsyncOpenSearch:
+        """Get the AsyncOpenSearch client of the running event loop."""
+        return await _get_shared_async_client()
+
+    async def create(self, id: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Create a new document."""
+        try:
+            doc = _stamp(id, data, _now())
+            client = await self._get_client()
+            await client.index(index=self.index_name, id=id, body=doc, refresh="wait_for")
+            _cache_evict(self.index_name, id)
+            logger.info("Created document %s in %s", id, self.index_name)
+            return doc
+        except Exception as e:
+            raise _write_error(e, f"creating document {id}", "Error creating document") from e
+
+    async def bulk_upsert(
+        self, docs: list[tuple[str, dict[str, Any]]]
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Create or replace many documents in one bulk request.
+
+        Returns the documents that were stored and the ids of those OpenSearch rejected.
+        """
+        try:
+            sources, actions = _bulk_actions(self.index_name, docs)
+            client = await self._get_client()
+            success, errors = await helpers.async_bulk(client, actions, **_BULK_OPTIONS)
+            return _bulk_result(self.index_name, sources, success, errors)
+        except Exception as e:
+            raise _write_error(e, "in bulk upsert", "Error creating documents") from e
+
+    async def get(self, id: str) -> dict[str, Any] | None:
+        """Get a document by ID."""
         try:
-            client = self._get_client()
+            cached = _cache_get(self.index_name, id)
+            if cached is not None:
+                return cached
+            client = await self._get_client()
+            response = await client.get(index=self.index_name, id=id)
+            doc: dict[str, Any] = response["_source"]
+            _cache_put(self.index_name, id, doc)
+            return doc
+        except exceptions.NotFoundError:
+            return None
+        except Exception as e:
+            logger.error("Error getting document %s: %s", id, e)
+            return None
 
-            response = client.search(
+    async def mget(self, ids: list[str]) -> list[dict[str, Any]]:
+        """Get several documents in one request, in `ids` order; missing ids are skipped."""
+        try:
+            client = await self._get_client()
+            response = await client.mget(index=self.index_name, body={"ids": ids})
+            return _found_sources(self.index_name, response)
+        except Exception as e:
+            logger.error("Error getting documents %s: %s", ids, e)
+            return []
+
+    async def update(self, id: str, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Update a document."""
+        try:
+            _cache_evict(self.index_name, id)
+            client = await self._get_client()
+            # _source=True returns the updated document, saving a follow-up get
+            response = await client.update(
                 index=self.index_name,
-                body={"query": {"match_all": {}}, "size": 1000, "sort": [{"created_at": "desc"}]},
+                id=id,
+                body=_update_body(data),
+                refresh="wait_for",
+                _source=True,
             )
-            return [hit["_source"] for hit in response["hits"]["hits"]]
+            doc: dict[str, Any] = response["get"]["_source"]
+            # Overwrites any pre-update copy a concurrent get() cached while the write was in flight
+            _cache_put(self.index_name, id, doc)
+            logger.info("Updated document %s in %s", id, self.index_name)
+            return doc
+        except exceptions.NotFoundError:
+            logger.warning("Document %s not found for update", id)
+            return None
+        except Exception as e:
+            logger.error("Error updating document %s: %s", id, e)
+            return None
+
+    async def delete(self, id: str) -> bool:
+        """Delete a document."""
+        try:
+            _cache_evict(self.index_name, id)
+            client = await self._get_client()
+            await client.delete(index=self.index_name, id=id, refresh="wait_for")
+            # Again: a concurrent get() may have re-cached it before the delete landed
+            _cache_evict(self.index_name, id)
+            logger.info("Deleted document %s from %s", id, self.index_name)
+            return True
+        except exceptions.NotFoundError:
+            logger.warning("Document %s not found for deletion", id)
+            return False
+        except Exception as e:
+            logger.error("Error deleting document %s: %s", id, e)
+            return False
+
+    async def list_page(
+        self, after: list[Any] | None = None, size: int = 200, fields: list[str] | None = None
+    ) -> tuple[list[dict[str, Any]], list[Any] | None]:
+        """One page of documents, newest first, and the cursor for the next page (or None)."""
+        client = await self._get_client()
+        response = await client.search(index=self.index_name, body=_page_query(after, size, fields))
+        return _page_result(response, size)
+
+    async def list(self, fields: list[str] | None = None) -> list[dict[str, Any]]:
+        """List all documents, optionally only the given _source fields."""
+        try:
+            docs: list[dict[str, Any]] = []
+            after = None
+            while True:
+                page, after = await self.list_page(after, fields=fields)
+                docs.extend(page)
+                if after is None:
+                    return docs
         except Exception as e:
-            logger.error(f"Error listing documents: {e}")
+            logger.error("Error listing documents: %s", e)
             return []
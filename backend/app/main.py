@@ -3,14 +3,37 @@ Main FastAPI application.
 Refactored from Flask to FastAPI for better performance and async support.
 """
 
+import logging
+import os
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import register_routers
+from .api.responses import ORJSONResponse, register_exception_handlers
+from .infrastructure.persistence.opensearch_store import close_async_client
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+# One level for every module logger under the app package
+logging.getLogger(__package__).setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+
+# Plain-def routes (MongoDB, S3, model search probes, ingestion jobs) block a worker thread each;
+# anyio's default limit of 40 caps how many of them can be in flight at once
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the sync-route threadpool on startup and release shared clients on shutdown."""
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+    await close_async_client()
+
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
@@ -18,6 +41,8 @@ def create_app() -> FastAPI:
         title="Marie RAG Indexing API",
         description="A modular and scalable system for RAG indexing with multiple sources",
         version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Enable CORS for all routes
@@ -31,8 +56,9 @@ def create_app() -> FastAPI:
 
     # Register all API routers
     register_routers(app)
+    register_exception_handlers(app)
 
-    print("FastAPI app created with modular architecture and CORS enabled")
+    logger.info("FastAPI app created with modular architecture and CORS enabled")
     return app
 
 
@@ -41,4 +67,4 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=5001, reload=True)
+    uvicorn.run(app, host="0.0.0.0", port=5001, reload=True, loop="uvloop", http="httptools")
@@ -1,14 +1,53 @@
 """Pytest configuration and fixtures."""
 
+import httpx
+import orjson
 import pytest
+import pytest_asyncio
+from app.api.routes.models import embedding_models
 from app.main import app
 from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI application."""
-    return TestClient(app)
+def load_json(response):
+    """Decode a test response body with orjson."""
+    return orjson.loads(response.content)
+
+
+@pytest.fixture(scope="session")
+def api_app():
+    """The application, with its OpenAPI schema built once for the session."""
+    # FastAPI caches the schema on the app, so later /openapi.json requests reuse it
+    app.openapi()
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(api_app):
+    """Test client shared by every test in the session (per xdist worker).
+
+    Entering the client runs the app lifespan once and keeps one event loop for
+    every request, instead of starting a new one per request.
+    """
+    with TestClient(api_app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client(api_app):
+    """Async client calling the app in-process, for tests that issue requests concurrently."""
+    transport = httpx.ASGITransport(app=api_app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _reset_models():
+    """Restore the in-memory model registry after each module; the client is shared."""
+    saved = dict(embedding_models)
+    yield
+    embedding_models.clear()
+    embedding_models.update(saved)
 
 
 @pytest.fixture
@@ -29,3 +68,20 @@ def mock_mongodb_connection(monkeypatch):
 
     monkeypatch.setattr("pymongo.MongoClient", mock_mongo_client)
     return mock_collection
+
+
+@pytest.fixture
+def unreachable_mongodb(monkeypatch):
+    """Make every MongoDB connection fail at once instead of waiting for a TCP timeout."""
+    from pymongo.errors import ServerSelectionTimeoutError
+
+    class UnreachableClient:
+        def __getattr__(self, name):
+            raise ServerSelectionTimeoutError("localhost:27017: connection refused")
+
+        def __getitem__(self, name):
+            return self
+
+    monkeypatch.setattr(
+        "app.api.routes.plugins.get_mongo_client", lambda *args, **kwargs: UnreachableClient()
+    )
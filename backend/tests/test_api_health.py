@@ -1,11 +1,13 @@
 """Tests for API health and basic endpoints."""
 
+from .conftest import load_json
+
 
 def test_root_endpoint(client):
     """Test the root endpoint returns correct response."""
     response = client.get("/")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "message" in data
     assert "version" in data
 
@@ -14,7 +16,7 @@ def test_health_check(client):
     """Test health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert data["status"] == "healthy"
 
 
@@ -22,7 +24,14 @@ def test_api_v1_stats(client):
     """Test stats endpoint returns correct structure."""
     response = client.get("/api/v1/stats")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     # Stats endpoint returns different structure with active_sources, etc
     assert isinstance(data, dict)
     assert len(data) > 0
+
+
+def test_openapi_schema(client, api_app):
+    """Test the OpenAPI document is served from the schema built at startup."""
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    assert load_json(response)["paths"].keys() == api_app.openapi_schema["paths"].keys()
@@ -0,0 +1,74 @@
+"""Tests for the buffering vector store wrapper."""
+
+import time
+
+import pytest
+from app.domain.models import Chunk
+from app.infrastructure.adapters.vector_stores.buffering import BufferingVectorStore
+
+
+class RecordingStore:
+    """Minimal vector store that records every upsert it receives."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[tuple[str, list[str]]] = []
+        self.fail = fail
+
+    def index_chunks(self, index_name, chunks):
+        if self.fail:
+            raise ConnectionError("store unavailable")
+        self.batches.append((index_name, [c.chunk_id for c in chunks]))
+        return len(chunks), 0
+
+    def flush(self):
+        pass
+
+    def search(self, index_name, query_vector, k=5, filters=None):
+        return [{"chunk_id": cid} for _, ids in self.batches for cid in ids][:k]
+
+
+def make_chunks(n, start=0):
+    return [
+        Chunk(content=f"chunk {i}", metadata={}, source_id="s", chunk_id=str(i))
+        for i in range(start, start + n)
+    ]
+
+
+def test_flushes_when_batch_is_full():
+    """Test that reaching batch_size sends the buffer without waiting for the timer."""
+    store = RecordingStore()
+    buffered = BufferingVectorStore(store, batch_size=3, flush_interval=60)
+    buffered.index_chunks("idx", make_chunks(2))
+    assert store.batches == []
+    buffered.index_chunks("idx", make_chunks(2, start=2))
+    assert store.batches == [("idx", ["0", "1", "2", "3"])]
+
+
+def test_flushes_after_interval():
+    """Test that a partial buffer is sent once flush_interval has passed."""
+    store = RecordingStore()
+    buffered = BufferingVectorStore(store, batch_size=100, flush_interval=0.05)
+    buffered.index_chunks("idx", make_chunks(2))
+    deadline = time.monotonic() + 2
+    while not store.batches and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.batches == [("idx", ["0", "1"])]
+
+
+def test_search_flushes_first():
+    """Test that search sees chunks that were still buffered."""
+    store = RecordingStore()
+    buffered = BufferingVectorStore(store, batch_size=100, flush_interval=60)
+    buffered.index_chunks("idx", make_chunks(2))
+    results = buffered.search("idx", [0.0], k=5)
+    assert [r["chunk_id"] for r in results] == ["0", "1"]
+
+
+def test_flush_raises_on_failed_writes():
+    """Test that flush reports chunks the wrapped store failed to index."""
+    buffered = BufferingVectorStore(RecordingStore(fail=True), batch_size=100, flush_interval=60)
+    buffered.index_chunks("idx", make_chunks(2))
+    with pytest.raises(RuntimeError, match="2 buffered chunks"):
+        buffered.flush()
+    # The failure is reported once
+    buffered.flush()
@@ -0,0 +1,64 @@
+"""CRUD tests shared by the resource endpoints (models, sources)."""
+
+import asyncio
+
+import pytest
+
+from .conftest import load_json
+
+RESOURCES = [
+    pytest.param(
+        "models",
+        {
+            "name": "Test Model",
+            "provider": "huggingface",
+            "model": "all-MiniLM-L6-v2",
+            "config": {},
+        },
+        id="models",
+    ),
+    pytest.param(
+        "sources",
+        {
+            "name": "Test Source",
+            "type": "local_file",
+            "config": {"path": "./test_docs"},
+        },
+        id="sources",
+    ),
+]
+
+
+@pytest.mark.parametrize(("endpoint", "payload"), RESOURCES)
+def test_list(client, endpoint, payload):
+    """Test listing all resources of a kind."""
+    response = client.get(f"/api/v1/{endpoint}")
+    assert response.status_code == 200
+    data = load_json(response)
+    assert endpoint in data
+    assert isinstance(data[endpoint], list)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("endpoint", "payload"), RESOURCES)
+async def test_lifecycle(async_client, endpoint, payload):
+    """Test creating, getting, listing and deleting a resource in isolation."""
+    url = f"/api/v1/{endpoint}"
+    create_response = await async_client.post(url, json=payload)
+    assert create_response.status_code == 200
+    resource_id = load_json(create_response)["id"]
+
+    # Fetch the resource and the listing concurrently
+    response, list_response = await asyncio.gather(
+        async_client.get(f"{url}/{resource_id}"), async_client.get(url)
+    )
+    assert response.status_code == 200
+    assert {"id": resource_id, "name": payload["name"]}.items() <= load_json(response).items()
+    assert resource_id in {item["id"] for item in load_json(list_response)[endpoint]}
+
+    response = await async_client.delete(f"{url}/{resource_id}")
+    assert response.status_code == 200
+
+    # Verify it's gone
+    get_response = await async_client.get(f"{url}/{resource_id}")
+    assert get_response.status_code == 404
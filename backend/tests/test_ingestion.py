@@ -1,5 +1,7 @@
 """Tests for ingestion endpoints."""
 
+from .conftest import load_json
+
 
 def test_start_ingestion(client):
     """Test starting an ingestion job."""
@@ -13,7 +15,7 @@ def test_start_ingestion(client):
     response = client.post("/api/v1/ingest", json=ingest_data)
     assert response.status_code in [200, 404]  # 404 if source doesn't exist
     if response.status_code == 200:
-        data = response.json()
+        data = load_json(response)
         assert "job_id" in data or "message" in data
 
 
@@ -21,7 +23,7 @@ def test_list_ingestion_jobs(client):
     """Test listing all ingestion jobs."""
     response = client.get("/api/v1/ingest/jobs")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "jobs" in data
     assert isinstance(data["jobs"], list)
 
@@ -30,7 +32,7 @@ def test_get_ingestion_logs(client):
     """Test getting ingestion logs."""
     response = client.get("/api/v1/ingest/logs")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "logs" in data
     assert isinstance(data["logs"], list)
 
@@ -44,3 +46,15 @@ def test_ingestion_validation(client):
     }
     response = client.post("/api/v1/ingest", json=invalid_data)
     assert response.status_code == 422  # Validation error
+
+
+def test_ingestion_validation_rejects_bad_settings(client):
+    """Test that invalid execution and chunk settings are rejected up front."""
+    invalid_data = {
+        "plugin_id": "local_file",
+        "execution_mode": "fastest",
+        "max_workers": 0,
+        "chunk_settings": {"chunk_size": "large"},
+    }
+    response = client.post("/api/v1/ingest", json=invalid_data)
+    assert response.status_code == 422
@@ -0,0 +1,45 @@
+"""Tests for the JSON file store."""
+
+import time
+
+from app.infrastructure.persistence import json_store
+from app.infrastructure.persistence.json_store import JSONStore
+
+
+def test_writes_back_after_debounce_and_reloads(tmp_path, monkeypatch):
+    """Test that mutations reach the file after the debounce and a new store reads them."""
+    monkeypatch.setattr(json_store, "FLUSH_DELAY", 0.05)
+    store = JSONStore("items.json", data_dir=tmp_path)
+    store.add({"id": "1", "name": "first"})
+    store.add({"id": "2", "name": "second"})
+    store.update("1", {"name": "renamed"})
+    store.delete("2")
+
+    deadline = time.monotonic() + 2
+    while store._dirty and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not store._dirty
+    assert not (tmp_path / "items.tmp").exists()
+
+    reloaded = JSONStore("items.json", data_dir=tmp_path)
+    assert reloaded.load() == [{"id": "1", "name": "renamed"}]
+
+
+def test_flush_writes_pending_changes(tmp_path):
+    """Test that flush (also run at exit) writes without waiting for the timer."""
+    store = JSONStore("items.json", data_dir=tmp_path)
+    store.save([{"id": "1", "config": {"path": "/data"}}])
+    store.flush()
+    assert JSONStore("items.json", data_dir=tmp_path).get("1") == {
+        "id": "1",
+        "config": {"path": "/data"},
+    }
+
+
+def test_returned_items_are_copies(tmp_path):
+    """Test that mutating loaded items does not change the store."""
+    store = JSONStore("items.json", data_dir=tmp_path)
+    store.add({"id": "1", "config": {"path": "/data"}})
+    store.load()[0]["config"]["path"] = "/elsewhere"
+    store.get("1")["config"]["path"] = "/elsewhere"
+    assert store.get("1") == {"id": "1", "config": {"path": "/data"}}
@@ -1,11 +1,18 @@
 """Tests for plugin endpoints."""
 
+import pytest
+
+from .conftest import load_json
+
+# Fail fast when no MongoDB is listening instead of waiting out server selection
+MONGO_TEST_URI = "mongodb://localhost:27017/?serverSelectionTimeoutMS=100&connectTimeoutMS=100"
+
 
 def test_list_plugins(client):
     """Test listing all available plugins."""
     response = client.get("/api/v1/plugins")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "plugins" in data
     assert isinstance(data["plugins"], list)
     assert len(data["plugins"]) > 0
@@ -21,26 +28,38 @@ def test_get_plugin_schema(client):
     # Test with mongodb plugin
     response = client.get("/api/v1/plugins/mongodb/schema")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "schema" in data
 
     # Test with local_file plugin
     response = client.get("/api/v1/plugins/local_file/schema")
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "schema" in data
 
 
+def test_plugin_schema_revalidates_with_etag(client):
+    """Test that a cached plugin schema answers If-None-Match with 304."""
+    response = client.get("/api/v1/plugins/mongodb/schema")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get("/api/v1/plugins/mongodb/schema", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
 def test_get_invalid_plugin_schema(client):
     """Test getting schema for non-existent plugin."""
     response = client.get("/api/v1/plugins/invalid_plugin/schema")
     assert response.status_code == 404
 
 
+@pytest.mark.integration
 def test_mongodb_databases_endpoint(client):
     """Test MongoDB databases listing endpoint."""
     request_data = {
-        "connection_string": "mongodb://localhost:27017",
+        "connection_string": MONGO_TEST_URI,
         "database": None,
     }
     response = client.post("/api/v1/plugins/mongodb/databases", json=request_data)
@@ -48,12 +67,29 @@ def test_mongodb_databases_endpoint(client):
     assert response.status_code in [200, 500]  # Allow connection errors
 
 
+@pytest.mark.integration
 def test_mongodb_collections_endpoint(client):
     """Test MongoDB collections listing endpoint."""
     request_data = {
-        "connection_string": "mongodb://localhost:27017",
+        "connection_string": MONGO_TEST_URI,
         "database": "test_db",
     }
     response = client.post("/api/v1/plugins/mongodb/collections", json=request_data)
     # This will fail without a real MongoDB, but should handle gracefully
     assert response.status_code in [200, 500]  # Allow connection errors
+
+
+def test_mongodb_databases_unreachable(client, unreachable_mongodb):
+    """Test that an unreachable MongoDB is reported as a connection timeout."""
+    request_data = {"connection_string": "mongodb://localhost:27017", "database": None}
+    response = client.post("/api/v1/plugins/mongodb/databases", json=request_data)
+    assert response.status_code == 500
+    assert "Connection Timeout" in load_json(response)["detail"]
+
+
+def test_mongodb_collections_unreachable(client, unreachable_mongodb):
+    """Test that an unreachable MongoDB is reported as a connection timeout."""
+    request_data = {"connection_string": "mongodb://localhost:27017", "database": "test_db"}
+    response = client.post("/api/v1/plugins/mongodb/collections", json=request_data)
+    assert response.status_code == 500
+    assert "Connection Timeout" in load_json(response)["detail"]
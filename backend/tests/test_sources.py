@@ -1,87 +1,59 @@
 """Tests for data source endpoints."""
 
-
-def test_list_sources(client):
-    """Test listing all sources."""
-    response = client.get("/api/v1/sources")
-    assert response.status_code == 200
-    data = response.json()
-    assert "sources" in data
-    assert isinstance(data["sources"], list)
-
-
-def test_create_source(client):
-    """Test creating a new source."""
-    source_data = {
-        "name": "Test Source",
-        "type": "local_file",
-        "config": {"path": "./test_docs"},
-    }
-    response = client.post("/api/v1/sources", json=source_data)
-    assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == source_data["name"]
-    assert data["type"] == source_data["type"]
-    assert "id" in data
-
-
-def test_get_source_by_id(client):
-    """Test getting a specific source by ID."""
-    # First create a source
-    source_data = {
-        "name": "Test Source",
-        "type": "local_file",
-        "config": {"path": "./test_docs"},
-    }
-    create_response = client.post("/api/v1/sources", json=source_data)
-    source_id = create_response.json()["id"]
-
-    # Now get it
-    response = client.get(f"/api/v1/sources/{source_id}")
+import pytest
+
+from .conftest import load_json
+
+SOURCES = "/api/v1/sources"
+SOURCE_DATA = {
+    "name": "Test Source",
+    "type": "local_file",
+    "config": {"path": "./test_docs"},
+}
+UPDATE_DATA = {
+    "name": "Updated Test Source",
+    "type": "local_file",
+    "config": {"path": "./updated_docs"},
+}
+
+
+@pytest.fixture(scope="module")
+def created_source(client):
+    """A source created once for the module; deleted when the module finishes."""
+    response = client.post(SOURCES, json=SOURCE_DATA)
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == source_id
-    assert data["name"] == source_data["name"]
+    source = load_json(response)
+    yield source
+    client.delete(f"{SOURCES}/{source['id']}")
 
 
-def test_update_source(client):
+def test_update_source(client, created_source):
     """Test updating a source."""
-    # First create a source
-    source_data = {
-        "name": "Test Source",
-        "type": "local_file",
-        "config": {"path": "./test_docs"},
-    }
-    create_response = client.post("/api/v1/sources", json=source_data)
-    source_id = create_response.json()["id"]
-
-    # Now update it
-    update_data = {
-        "name": "Updated Test Source",
-        "type": "local_file",
-        "config": {"path": "./updated_docs"},
-    }
-    response = client.put(f"/api/v1/sources/{source_id}", json=update_data)
+    response = client.put(f"{SOURCES}/{created_source['id']}", json=UPDATE_DATA)
     assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == update_data["name"]
-
-
-def test_delete_source(client):
-    """Test deleting a source."""
-    # First create a source
-    source_data = {
-        "name": "Test Source",
-        "type": "local_file",
-        "config": {"path": "./test_docs"},
-    }
-    create_response = client.post("/api/v1/sources", json=source_data)
-    source_id = create_response.json()["id"]
-
-    # Now delete it
-    response = client.delete(f"/api/v1/sources/{source_id}")
-    assert response.status_code == 200
-
-    # Verify it's gone
-    get_response = client.get(f"/api/v1/sources/{source_id}")
-    assert get_response.status_code == 404
+    data = load_json(response)
+    assert data["name"] == UPDATE_DATA["name"]
+
+
+def test_bulk_create_sources_reports_rejected_writes(client, monkeypatch):
+    """Test that documents OpenSearch rejected are not returned as created."""
+    from opensearchpy import helpers
+
+    async def fake_async_bulk(client, actions, **kwargs):
+        actions = list(actions)
+        rejected = actions[1]["_id"]
+        errors = [{"index": {"_id": rejected, "status": 400, "error": "mapper_parsing_exception"}}]
+        return len(actions) - 1, errors
+
+    monkeypatch.setattr(helpers, "async_bulk", fake_async_bulk)
+
+    sources = [
+        {"name": f"Bulk Source {i}", "type": "local_file", "config": {"path": "./test_docs"}}
+        for i in range(3)
+    ]
+    response = client.post(f"{SOURCES}/bulk", json=sources)
+    assert response.status_code == 207
+    data = load_json(response)
+    assert len(data["sources"]) == 2
+    assert len(data["failed"]) == 1
+    assert data["failed"][0] not in {source["id"] for source in data["sources"]}
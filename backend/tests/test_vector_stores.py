@@ -1,73 +1,73 @@
 """Tests for vector store endpoints."""
 
+from app.api.routes import vector_stores
+
+from .conftest import load_json
+
+VECTOR_STORES = "/api/v1/vector-stores"
+STORE_DATA = {
+    "name": "Test Vector Store",
+    "type": "opensearch",
+    "config": {
+        "url": "http://localhost:9200",
+        "index_name": "test_index",
+    },
+}
+
 
 def test_list_vector_stores(client):
     """Test listing all vector stores."""
-    response = client.get("/api/v1/vector-stores")
+    response = client.get(VECTOR_STORES)
     assert response.status_code == 200
-    data = response.json()
+    data = load_json(response)
     assert "vector_stores" in data
     assert isinstance(data["vector_stores"], list)
 
 
 def test_create_vector_store(client):
     """Test creating a new vector store."""
-    store_data = {
-        "name": "Test Vector Store",
-        "type": "opensearch",
-        "config": {
-            "url": "http://localhost:9200",
-            "index_name": "test_index",
-        },
-    }
-    response = client.post("/api/v1/vector-stores", json=store_data)
+    response = client.post(VECTOR_STORES, json=STORE_DATA)
     assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == store_data["name"]
-    assert data["type"] == store_data["type"]
+    data = load_json(response)
+    assert {"name": STORE_DATA["name"], "type": STORE_DATA["type"]}.items() <= data.items()
     assert "id" in data
 
 
 def test_get_vector_store_by_id(client):
     """Test getting a specific vector store by ID."""
     # First create a vector store
-    store_data = {
-        "name": "Test Vector Store",
-        "type": "opensearch",
-        "config": {
-            "url": "http://localhost:9200",
-            "index_name": "test_index",
-        },
-    }
-    create_response = client.post("/api/v1/vector-stores", json=store_data)
-    store_id = create_response.json()["id"]
+    create_response = client.post(VECTOR_STORES, json=STORE_DATA)
+    store_id = load_json(create_response)["id"]
 
     # Now get it
-    response = client.get(f"/api/v1/vector-stores/{store_id}")
+    response = client.get(f"{VECTOR_STORES}/{store_id}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == store_id
-    assert data["name"] == store_data["name"]
+    assert {"id": store_id, "name": STORE_DATA["name"]}.items() <= load_json(response).items()
 
 
 def test_delete_vector_store(client):
     """Test deleting a vector store."""
     # First create a vector store
-    store_data = {
-        "name": "Test Vector Store",
-        "type": "opensearch",
-        "config": {
-            "url": "http://localhost:9200",
-            "index_name": "test_index",
-        },
-    }
-    create_response = client.post("/api/v1/vector-stores", json=store_data)
-    store_id = create_response.json()["id"]
+    create_response = client.post(VECTOR_STORES, json=STORE_DATA)
+    store_id = load_json(create_response)["id"]
 
     # Now delete it
-    response = client.delete(f"/api/v1/vector-stores/{store_id}")
+    response = client.delete(f"{VECTOR_STORES}/{store_id}")
     assert response.status_code == 200
 
     # Verify it's gone
-    get_response = client.get(f"/api/v1/vector-stores/{store_id}")
+    get_response = client.get(f"{VECTOR_STORES}/{store_id}")
     assert get_response.status_code == 404
+
+
+def test_list_indices_of_unreachable_store(client, monkeypatch):
+    """Test that a store that cannot connect lists no indices instead of failing."""
+
+    class UnreachableStore:
+        def __init__(self, config=None):
+            raise ConnectionError("connection refused")
+
+    monkeypatch.setitem(vector_stores.VECTOR_STORE_PLUGINS, "qdrant", UnreachableStore)
+    response = client.get("/api/v1/indices", params={"vector_store": "qdrant"})
+    assert response.status_code == 200
+    assert load_json(response) == {"indices": [], "error": "connection refused"}